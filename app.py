@@ -17,20 +17,42 @@ Based on analysis of SaaSquatchLeads reference tool which provides:
 - AI-powered outreach tools
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify
 import csv
 import json
 import os
 import io
 import requests
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict, field, fields, replace
+from typing import Callable, List, Dict, Optional
 import time
 import random
-import re
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import threading
+import atexit
+import tempfile
+import zlib
+import base64
+import hashlib
+import heapq
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from async_fetch import AIOHTTP_AVAILABLE, fetch_all
+from compact import DATACLASS_SLOTS, intern_fields
+from contact_extract import ContactInfo, extract_contacts
+from domain_cache import DISALLOWED, ERROR, DomainCache, DomainOutcome, classify_exception, outcome_for_status
+from driver_pool import DriverPool, DriverUnavailable
+from email_templates import APP_TEMPLATES
+from html_extract import LISTING_EXTRACTORS
+from http_cache import ResponseCache
+from jobs import JobQueue
+from lead_store import LeadStore, SQLiteLeadStore
+from rate_limit import HostRateLimiter
+from robots_cache import robots_cache
+from scoring_rules import APP_INDUSTRY_RULES, APP_TITLE_RULES, score_app_revenue
+from transport import DEFAULT_POOL_MAXSIZE, CircuitBreaker, install_transport
 
 # Selenium imports with error handling
 try:
@@ -45,7 +67,50 @@ except ImportError:
 
 app = Flask(__name__)
 
-@dataclass
+# Enrichment concurrency: total worker threads and simultaneous requests per host
+ENRICHMENT_WORKERS = int(os.environ.get('ENRICHMENT_WORKERS', '8'))
+ENRICHMENT_PER_HOST = int(os.environ.get('ENRICHMENT_PER_HOST', '2'))
+
+# Fetch company sites for a whole batch from one asyncio loop when aiohttp
+# is installed (see async_fetch.py); otherwise each worker thread fetches
+ASYNC_FETCH_ENABLED = os.environ.get('ASYNC_FETCH_ENABLED', '1') == '1'
+
+# On-disk response cache for scraped pages and company sites (see http_cache.py)
+HTTP_CACHE_ENABLED = os.environ.get('HTTP_CACHE_ENABLED', '1') == '1'
+
+# Most source x query combinations one /api/scrape request may fan out to
+SCRAPE_MAX_PAIRS = int(os.environ.get('SCRAPE_MAX_PAIRS', '16'))
+
+# Background workers for scrape/upload jobs (see jobs.py), and how many of
+# each job's newest results it keeps for pollers (all leads stay in the store)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '4'))
+JOB_MAX_RESULTS = int(os.environ.get('JOB_MAX_RESULTS', '1000'))
+
+# Optional SQLite lead storage shared by all workers; in-memory when unset
+LEAD_DB_PATH = os.environ.get('LEAD_DB_PATH', '')
+STORE_BATCH_SIZE = int(os.environ.get('STORE_BATCH_SIZE', '100'))
+
+# CSV uploads are parsed incrementally in batches of this many rows
+UPLOAD_BATCH_ROWS = int(os.environ.get('UPLOAD_BATCH_ROWS', '500'))
+
+# /api/export flushes the CSV to the client in chunks of roughly this size
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# /api/leads page size when ?limit= is not given, and the largest allowed
+LEADS_PAGE_SIZE = 100
+LEADS_MAX_PAGE_SIZE = 1000
+
+# Warm headless browsers shared by Selenium scrapes (see driver_pool.py)
+SELENIUM_POOL_SIZE = int(os.environ.get('SELENIUM_POOL_SIZE', '2'))
+SELENIUM_MAX_PAGES = int(os.environ.get('SELENIUM_MAX_PAGES', '50'))
+SELENIUM_MAX_HEAP_MB = float(os.environ.get('SELENIUM_MAX_HEAP_MB', '512'))
+# Browsers started in the background at startup, so the first scrape does not pay for the launch
+SELENIUM_WARM = int(os.environ.get('SELENIUM_WARM', '1'))
+
+# Repeated across many leads; interned so identical values share one string
+LEAD_CATEGORICAL_FIELDS = ('title', 'revenue', 'industry', 'location', 'employees', 'source', 'template_id')
+
+@dataclass(**DATACLASS_SLOTS)
 class Lead:
    """Enhanced Lead dataclass with additional enrichment fields"""
    first_name: str
@@ -62,67 +127,124 @@ class Lead:
    employees: str = ""
    source: str = ""
    score: int = 0
-   email_template: str = ""
+   template_id: str = ""
    enriched: bool = False
    created_date: str = ""
+   id: int = 0
+   
+   def __post_init__(self):
+       intern_fields(self, LEAD_CATEGORICAL_FIELDS)
+
+@dataclass
+class Page:
+   """A fetched web page, downloaded once and shared by every extractor"""
+   url: str
+   status_code: int
+   text: str
+   _contacts: Optional[ContactInfo] = field(default=None, repr=False, compare=False)
+   
+   def contacts(self) -> ContactInfo:
+       """Emails, phones and social links, scanned once and shared by every extractor"""
+       if self._contacts is None:
+           self._contacts = extract_contacts(self.text)
+       return self._contacts
+
+@dataclass
+class CompanyProfile:
+   """Website enrichment for one company, computed once and copied to each of its contacts"""
+   website: str = ""
+   updates: Dict[str, object] = field(default_factory=dict)
+   
+   def apply(self, lead: 'Lead') -> None:
+       """Fill the contact's empty fields; company data never replaces the contact's own"""
+       if self.website and not lead.website:
+           lead.website = self.website
+       for name, value in self.updates.items():
+           if not getattr(lead, name):
+               setattr(lead, name, value)
+
+def find_emails(text: str) -> List[str]:
+   """Unique email addresses in text, minus obvious placeholders"""
+   return extract_contacts(text).emails
+
+def extract_email_contact(page: Page, lead: Lead) -> None:
+   """Extractor: first email address found on the page"""
+   emails = page.contacts().emails
+   if emails:
+       lead.email = emails[0]
+
+def extract_phone_contact(page: Page, lead: Lead) -> None:
+   """Extractor: first phone number found on the page"""
+   phones = page.contacts().phones
+   if phones:
+       lead.phone = phones[0]
+
+def company_website_url(company_name: str) -> str:
+   """Best-guess homepage for a company name"""
+   return f"https://www.{company_name.lower().replace(' ', '').replace(',', '')}.com"
+
+# Extractors run in order, once per company, over its fetched homepage; each
+# one receives the shared Page and sets fields on a blank probe lead, and the
+# fields it sets fill the empty fields of every contact at that company
+DEFAULT_EXTRACTORS = [extract_email_contact, extract_phone_contact]
+
+# Field defaults, for telling which fields an extractor set on the probe lead
+BLANK_LEAD = Lead(first_name="", last_name="", company_name="", title="", revenue="", industry="", email="")
 
 class LeadProcessor:
    """Core lead processing engine with real web scraping capabilities"""
    
-   def __init__(self):
-       self.leads: List[Lead] = []
+   def __init__(self, max_workers: int = ENRICHMENT_WORKERS, per_host_limit: int = ENRICHMENT_PER_HOST,
+                response_cache: Optional[ResponseCache] = None, lead_db_path: str = LEAD_DB_PATH):
+       self.store = SQLiteLeadStore(lead_db_path, Lead) if lead_db_path else LeadStore()
        self.processed_count = 0
+       self._processed_count_lock = threading.Lock()
+       self.max_workers = max(1, max_workers)
+       self.per_host_limit = max(1, per_host_limit)
+       self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+       self._host_slots_lock = threading.Lock()
+       self.extractors = list(DEFAULT_EXTRACTORS)
        self.session = requests.Session()
        self.session.headers.update({
            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
        })
+       if response_cache is None and HTTP_CACHE_ENABLED:
+           response_cache = ResponseCache()
+       self.response_cache = response_cache
+       # Pooled keep-alive connections, retries with backoff and a per-host
+       # circuit breaker (shared with the async fetch path), under the cache
+       self.breaker = CircuitBreaker()
+       install_transport(self.session, cache=self.response_cache, breaker=self.breaker,
+                         pool_maxsize=max(DEFAULT_POOL_MAXSIZE, self.max_workers))
+       # Per-domain enrichment outcomes (resolved/dead/...) shared by all leads
+       self.domain_cache = DomainCache()
+       self.rate_limiter = HostRateLimiter(
+           crawl_delay=lambda url: robots_cache.crawl_delay(self.session, url)
+       )
+       self.driver_pool = None
+       if SELENIUM_AVAILABLE:
+           self.driver_pool = DriverPool(
+               self.setup_selenium_driver,
+               max_size=SELENIUM_POOL_SIZE,
+               max_pages=SELENIUM_MAX_PAGES,
+               max_heap_mb=SELENIUM_MAX_HEAP_MB
+           )
+           atexit.register(self.driver_pool.close)
+           if SELENIUM_WARM > 0:
+               threading.Thread(target=self.driver_pool.warm, args=(SELENIUM_WARM,),
+                                name='driver-warm', daemon=True).start()
        
    def score_title(self, title: str) -> int:
        """Enhanced scoring based on SaaSquatchLeads decision-maker focus"""
-       title_lower = title.lower()
-       if any(key in title_lower for key in ["ceo", "chief executive", "founder", "president"]):
-           return 10
-       if any(key in title_lower for key in ["cfo", "chief financial"]):
-           return 9
-       if any(key in title_lower for key in ["cto", "chief technology", "chief technical"]):
-           return 8
-       if any(key in title_lower for key in ["vp", "vice president", "svp"]):
-           return 7
-       if any(key in title_lower for key in ["director", "head of"]):
-           return 5
-       if any(key in title_lower for key in ["manager", "lead"]):
-           return 3
-       return 1
+       return APP_TITLE_RULES.score(title)
    
    def score_revenue(self, revenue: str) -> int:
        """Revenue scoring aligned with acquisition targets"""
-       try:
-           rev_num = float(revenue.replace("$", "").replace(",", "").replace("M", "000000").replace("B", "000000000"))
-           if 10_000_000 <= rev_num <= 100_000_000:
-               return 10
-           elif 5_000_000 <= rev_num < 10_000_000:
-               return 8
-           elif 1_000_000 <= rev_num < 5_000_000:
-               return 6
-           elif rev_num > 100_000_000:
-               return 4
-           else:
-               return 2
-       except:
-           return 1
+       return score_app_revenue(revenue)
    
    def score_industry(self, industry: str) -> int:
        """Industry scoring for acquisition appeal"""
-       industry_lower = industry.lower()
-       if any(key in industry_lower for key in ["saas", "software", "technology", "fintech"]):
-           return 8
-       if any(key in industry_lower for key in ["subscription", "membership", "recurring"]):
-           return 7
-       if any(key in industry_lower for key in ["healthcare", "education", "consulting"]):
-           return 6
-       if any(key in industry_lower for key in ["manufacturing", "logistics", "distribution"]):
-           return 4
-       return 2
+       return APP_INDUSTRY_RULES.score(industry)
    
    def calculate_score(self, lead: Lead) -> int:
        """Calculate composite lead score"""
@@ -137,91 +259,70 @@ class LeadProcessor:
        
        return title_score + revenue_score + industry_score + enrichment_bonus
    
-   def generate_personalized_email(self, lead: Lead) -> str:
-       """Generate AI-inspired personalized outreach templates"""
-       templates = {
-           "high_exec": f"""Subject: Quick chat about {lead.company_name}'s growth trajectory
-
-Hi {lead.first_name},
-
-Hope you're doing well. As {lead.title} at {lead.company_name}, you're probably focused on scaling operations and exploring strategic opportunities.
-
-At Caprae Capital, we specialize in partnering with {lead.industry.lower()} companies like yours to accelerate growth through our operator-first approach. Rather than just capital, we bring hands-on operational expertise.
-
-Would you be open to a brief conversation about {lead.company_name}'s growth plans?
-
-Best regards,
-[Your Name]
-Caprae Capital Partners""",
-           
-           "mid_level": f"""Subject: Operational efficiency insights for {lead.company_name}
-
-Hi {lead.first_name},
-
-I came across {lead.company_name} and was impressed by your position in the {lead.industry.lower()} space.
-
-As {lead.title}, you likely see firsthand the operational challenges that come with growth. At Caprae Capital, we've helped similar companies streamline operations and unlock new opportunities through our SaaS and M&A-as-a-Service models.
-
-Would you be interested in a quick call to discuss how we could support {lead.company_name}'s operational goals?
-
-Best,
-[Your Name]
-Caprae Capital""",
-           
-           "standard": f"""Subject: Partnership opportunity for {lead.company_name}
-
-Hello {lead.first_name},
-
-I hope this message finds you well. I'm reaching out because {lead.company_name} caught our attention as an innovative player in the {lead.industry.lower()} sector.
-
-At Caprae Capital, we focus on empowering businesses through strategic partnerships and operational support. Our unique approach combines capital with hands-on expertise to help companies achieve sustainable growth.
-
-I'd love to explore how we might be able to support {lead.company_name}'s objectives.
-
-Kind regards,
-[Your Name]
-Caprae Capital Partners"""
-       }
-       
-       score = self.calculate_score(lead)
-       if score >= 20:
-           return templates["high_exec"]
-       elif score >= 15:
-           return templates["mid_level"]
-       else:
-           return templates["standard"]
+   def generate_personalized_email(self, lead: Lead, score: Optional[int] = None) -> str:
+       """Render the outreach template matching the lead's score"""
+       if score is None:
+           score = self.calculate_score(lead)
+       return APP_TEMPLATES.render(lead, score)
+   
+   def render_email(self, lead: Lead) -> str:
+       """Render a processed lead's email from its stored template id"""
+       template = APP_TEMPLATES.get(lead.template_id)
+       if template is None:
+           return self.generate_personalized_email(lead, lead.score)
+       return template.render(lead)
+   
+   def add_processed(self, count: int) -> None:
+       """Add to processed_count; job workers call this concurrently"""
+       with self._processed_count_lock:
+           self.processed_count += count
+   
+   def reset_processed(self) -> None:
+       with self._processed_count_lock:
+           self.processed_count = 0
+   
+   def host_slot(self, url: str) -> threading.BoundedSemaphore:
+       """Semaphore bounding concurrent requests to the host of url"""
+       host = urlparse(url).netloc.lower()
+       with self._host_slots_lock:
+           slot = self._host_slots.get(host)
+           if slot is None:
+               slot = threading.BoundedSemaphore(self.per_host_limit)
+               self._host_slots[host] = slot
+           return slot
    
-   def respect_rate_limits(self):
-       """Add delays to respect websites"""
-       time.sleep(random.uniform(1, 3))
+   def respect_rate_limits(self, url: str) -> None:
+       """Wait for url's host token bucket; other hosts are not delayed"""
+       self.rate_limiter.acquire(url)
    
-   def check_robots_txt(self, base_url: str) -> bool:
-       """Check if scraping is allowed by robots.txt"""
+   def check_robots_txt(self, url: str) -> bool:
+       """Check if scraping url is allowed by its host's (cached) robots.txt"""
        try:
-           robots_url = urljoin(base_url, '/robots.txt')
-           response = self.session.get(robots_url, timeout=5)
-           
-           if response.status_code == 200:
-               if 'Disallow: /' in response.text:
-                   return False
-           return True
-       except:
+           return robots_cache.can_fetch(self.session, url)
+       except Exception as e:
+           print(f"robots.txt check failed for {url}: {e}")
            return True
    
+   def fetch_page(self, url: str, timeout: int = 5) -> Page:
+       """Download a page once so several extractors can share the body"""
+       self.respect_rate_limits(url)
+       response = self.session.get(url, timeout=timeout)
+       return Page(url=url, status_code=response.status_code, text=response.text)
+   
+   def register_extractor(self, extractor) -> None:
+       """Add an extractor callable(page, lead) to the enrichment pipeline"""
+       self.extractors.append(extractor)
+       # Cached company profiles were extracted without it
+       self.domain_cache.clear()
+   
    def extract_emails_from_website(self, url: str) -> List[str]:
        """Extract email addresses from a website"""
        emails = []
        
        try:
-           response = self.session.get(url, timeout=5)
-           if response.status_code == 200:
-               email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-               emails = re.findall(email_pattern, response.text)
-               
-               emails = list(set(emails))
-               emails = [email for email in emails if not any(
-                   skip in email.lower() for skip in ['example.com', 'test.com', 'placeholder']
-               )]
+           page = self.fetch_page(url)
+           if page.status_code == 200:
+               emails = find_emails(page.text)
                
        except Exception as e:
            print(f"Email extraction failed for {url}: {e}")
@@ -250,43 +351,43 @@ Caprae Capital Partners"""
    def scrape_with_selenium(self, url: str, query: str) -> List[Lead]:
        """Advanced scraping using Selenium for JavaScript-heavy sites"""
        leads = []
-       driver = self.setup_selenium_driver()
        
-       if not driver:
+       if not self.driver_pool:
            return leads
        
        try:
-           driver.get(url)
-           WebDriverWait(driver, 10).until(
-               EC.presence_of_element_located((By.TAG_NAME, "body"))
-           )
-           
-           self.respect_rate_limits()
-           
-           company_elements = driver.find_elements(By.CSS_SELECTOR, "[data-test*='company'], .company-name, .org-name")
-           
-           for i, element in enumerate(company_elements[:3]):
-               try:
-                   company_name = element.text.strip()
-                   if company_name and len(company_name) > 2:
-                       lead = Lead(
-                           first_name="Selenium",
-                           last_name=f"Contact{i+1}",
-                           company_name=company_name,
-                           title="Executive",
-                           revenue="15000000",
-                           industry="Technology",
-                           email=f"contact@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
-                           source="Selenium Scraper"
-                       )
-                       leads.append(lead)
-               except Exception:
-                   continue
+           # Drivers are leased from a warm pool; one that errors is recycled
+           with self.driver_pool.lease(timeout=30) as driver:
+               self.respect_rate_limits(url)
+               driver.get(url)
+               WebDriverWait(driver, 10).until(
+                   EC.presence_of_element_located((By.TAG_NAME, "body"))
+               )
+               
+               company_elements = driver.find_elements(By.CSS_SELECTOR, "[data-test*='company'], .company-name, .org-name")
+               
+               for i, element in enumerate(company_elements[:3]):
+                   try:
+                       company_name = element.text.strip()
+                       if company_name and len(company_name) > 2:
+                           lead = Lead(
+                               first_name="Selenium",
+                               last_name=f"Contact{i+1}",
+                               company_name=company_name,
+                               title="Executive",
+                               revenue="15000000",
+                               industry="Technology",
+                               email=f"contact@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
+                               source="Selenium Scraper"
+                           )
+                           leads.append(lead)
+                   except Exception:
+                       continue
                    
+       except DriverUnavailable as e:
+           print(f"Selenium unavailable: {e}")
        except Exception as e:
            print(f"Selenium scraping failed: {e}")
-       finally:
-           driver.quit()
            
        return leads
    
@@ -313,6 +414,52 @@ Caprae Capital Partners"""
        
        return leads
    
+   def scrape_many(self, sources: List[str], queries: List[str],
+                   on_leads: Optional[Callable[[str, List[Lead]], None]] = None) -> List[Lead]:
+       """Scrape every source for every query concurrently and merge the results.
+       
+       Leads are deduplicated by email across all sources. on_leads(source, new_leads)
+       is called from this thread as each source finishes, fastest first.
+       """
+       pairs = [(source, query) for source in sources for query in queries]
+       merged: List[Lead] = []
+       seen_emails = set()
+       with ThreadPoolExecutor(max_workers=max(1, len(pairs)), thread_name_prefix='scrape') as pool:
+           futures = {pool.submit(self.scrape_real_leads, source, query): source for source, query in pairs}
+           for future in as_completed(futures):
+               new_leads = []
+               for lead in future.result():
+                   key = lead.email.lower()
+                   if key and key in seen_emails:
+                       continue
+                   seen_emails.add(key)
+                   new_leads.append(lead)
+               merged.extend(new_leads)
+               if on_leads is not None and new_leads:
+                   on_leads(futures[future], new_leads)
+       return merged
+   
+   def fetch_listing(self, url: str):
+       """Polite GET of one directory page; None when disallowed or failed"""
+       try:
+           if not self.check_robots_txt(url):
+               return None
+           self.respect_rate_limits(url)
+           return self.session.get(url, timeout=10)
+       except Exception as e:
+           print(f"Failed to scrape {url}: {e}")
+           return None
+   
+   def fetch_listings(self, urls: List[str]):
+       """Yield (url, response) in list order, fetching each candidate only when asked for.
+       
+       Later candidates are fallbacks: a scraper that breaks out early never
+       contacts them. Concurrency comes from scrape_many running sources and
+       queries in parallel.
+       """
+       for url in urls:
+           yield url, self.fetch_listing(url)
+   
    def scrape_apollo_alternative(self, query: str) -> List[Lead]:
        """Scrape public company directories as Apollo alternative"""
        leads = []
@@ -324,58 +471,29 @@ Caprae Capital Partners"""
                "https://builtwith.com/websites/recently-created"
            ]
            
-           for source_url in sources:
-               if not self.check_robots_txt(source_url):
-                   continue
-                   
-               try:
-                   response = self.session.get(source_url, timeout=10)
-                   if response.status_code == 200:
-                       soup = BeautifulSoup(response.content, 'html.parser')
-                       
-                       # Extract company information from various selectors
-                       company_selectors = [
-                           'a[href*="/organization/"]',
-                           '.company-name',
-                           '.org-name',
-                           '[data-test*="company"]'
-                       ]
-                       
-                       for selector in company_selectors:
-                           companies = soup.select(selector)
-                           
-                           for i, company in enumerate(companies[:2]):
-                               try:
-                                   company_name = company.get_text(strip=True)
-                                   if company_name and len(company_name) > 3:
-                                       lead = Lead(
-                                           first_name="Business",
-                                           last_name=f"Executive{i+1}",
-                                           company_name=company_name,
-                                           title="CEO",
-                                           revenue="25000000",
-                                           industry="Technology",
-                                           email=f"contact@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
-                                           source="Apollo Alternative"
-                                       )
-                                       leads.append(lead)
-                                       
-                                       if len(leads) >= 3:
-                                           break
-                               except Exception:
-                                   continue
-                           
-                           if len(leads) >= 3:
-                               break
-                       
-                       if len(leads) >= 3:
-                           break
-                           
-                       self.respect_rate_limits()
-                       
-               except Exception as e:
-                   print(f"Failed to scrape {source_url}: {e}")
+           # Fallback candidates are fetched only if earlier ones fall short
+           for source_url, response in self.fetch_listings(sources):
+               if response is None or response.status_code != 200:
                    continue
+               
+               # Precompiled lxml selectors; stops once enough names are found
+               companies = LISTING_EXTRACTORS['apollo'].extract(response.content, limit=3 - len(leads))
+               
+               for i, company_name in companies:
+                   lead = Lead(
+                       first_name="Business",
+                       last_name=f"Executive{i+1}",
+                       company_name=company_name,
+                       title="CEO",
+                       revenue="25000000",
+                       industry="Technology",
+                       email=f"contact@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
+                       source="Apollo Alternative"
+                   )
+                   leads.append(lead)
+               
+               if len(leads) >= 3:
+                   break
                    
        except Exception as e:
            print(f"Apollo alternative scraping failed: {e}")
@@ -401,54 +519,28 @@ Caprae Capital Partners"""
                    f"https://www.indeed.com/companies/search?q={company_keyword}"
                ]
                
-               for url in alternative_urls:
-                   try:
-                       if not self.check_robots_txt(url):
-                           continue
-                           
-                       response = self.session.get(url, timeout=10)
-                       if response.status_code == 200:
-                           soup = BeautifulSoup(response.content, 'html.parser')
-                           
-                           # Extract company names from search results
-                           company_selectors = [
-                               '.company-name',
-                               '[data-test*="employer"]',
-                               '.employerName'
-                           ]
-                           
-                           for selector in company_selectors:
-                               elements = soup.select(selector)
-                               
-                               for i, element in enumerate(elements[:2]):
-                                   company_name = element.get_text(strip=True)
-                                   if company_name and len(company_name) > 3:
-                                       lead = Lead(
-                                           first_name="Professional",
-                                           last_name=f"Contact{i+1}",
-                                           company_name=company_name,
-                                           title="CFO",
-                                           revenue="35000000",
-                                           industry="Fintech",
-                                           email=f"exec@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
-                                           source="LinkedIn Alternative"
-                                       )
-                                       leads.append(lead)
-                                       
-                                       if len(leads) >= 2:
-                                           break
-                               
-                               if len(leads) >= 2:
-                                   break
-                           
-                           self.respect_rate_limits()
-                           
-                           if len(leads) >= 2:
-                               break
-                               
-                   except Exception as e:
-                       print(f"Failed to scrape {url}: {e}")
+               for url, response in self.fetch_listings(alternative_urls):
+                   if response is None or response.status_code != 200:
                        continue
+                   
+                   # Extract company names from search results
+                   companies = LISTING_EXTRACTORS['linkedin'].extract(response.content, limit=2 - len(leads))
+                   
+                   for i, company_name in companies:
+                       lead = Lead(
+                           first_name="Professional",
+                           last_name=f"Contact{i+1}",
+                           company_name=company_name,
+                           title="CFO",
+                           revenue="35000000",
+                           industry="Fintech",
+                           email=f"exec@{company_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
+                           source="LinkedIn Alternative"
+                       )
+                       leads.append(lead)
+                   
+                   if len(leads) >= 2:
+                       break
                        
        except Exception as e:
            print(f"LinkedIn alternative scraping failed: {e}")
@@ -466,57 +558,28 @@ Caprae Capital Partners"""
                "https://betalist.com/"
            ]
            
-           for source_url in startup_sources:
-               try:
-                   if not self.check_robots_txt(source_url):
-                       continue
-                       
-                   response = self.session.get(source_url, timeout=10)
-                   if response.status_code == 200:
-                       soup = BeautifulSoup(response.content, 'html.parser')
-                       
-                       # Extract startup information
-                       startup_selectors = [
-                           '.startup-link',
-                           '.product-name',
-                           '[data-test*="product"]'
-                       ]
-                       
-                       for selector in startup_selectors:
-                           startups = soup.select(selector)
-                           
-                           for i, startup in enumerate(startups[:2]):
-                               try:
-                                   startup_name = startup.get_text(strip=True)
-                                   if startup_name and len(startup_name) > 3:
-                                       lead = Lead(
-                                           first_name="Startup",
-                                           last_name=f"Founder{i+1}",
-                                           company_name=startup_name,
-                                           title="Founder",
-                                           revenue="8000000",
-                                           industry="E-commerce",
-                                           email=f"founder@{startup_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
-                                           source="Crunchbase Alternative"
-                                       )
-                                       leads.append(lead)
-                                       
-                                       if len(leads) >= 2:
-                                           break
-                               except Exception:
-                                   continue
-                           
-                           if len(leads) >= 2:
-                               break
-                       
-                       self.respect_rate_limits()
-                       
-                       if len(leads) >= 2:
-                           break
-                           
-               except Exception as e:
-                   print(f"Failed to scrape {source_url}: {e}")
+           for source_url, response in self.fetch_listings(startup_sources):
+               if response is None or response.status_code != 200:
                    continue
+               
+               # Extract startup information
+               startups = LISTING_EXTRACTORS['crunchbase'].extract(response.content, limit=2 - len(leads))
+               
+               for i, startup_name in startups:
+                   lead = Lead(
+                       first_name="Startup",
+                       last_name=f"Founder{i+1}",
+                       company_name=startup_name,
+                       title="Founder",
+                       revenue="8000000",
+                       industry="E-commerce",
+                       email=f"founder@{startup_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
+                       source="Crunchbase Alternative"
+                   )
+                   leads.append(lead)
+               
+               if len(leads) >= 2:
+                   break
                    
        except Exception as e:
            print(f"Crunchbase alternative scraping failed: {e}")
@@ -536,99 +599,140 @@ Caprae Capital Partners"""
            
            search_query = query.replace(' ', '+')
            
-           for base_url in directory_sources:
-               try:
-                   if not self.check_robots_txt(base_url):
-                       continue
-                       
-                   # Try to access directory listings
-                   response = self.session.get(base_url, timeout=10)
-                   if response.status_code == 200:
-                       soup = BeautifulSoup(response.content, 'html.parser')
-                       
-                       # Extract business names
-                       business_selectors = [
-                           '.business-name',
-                           '.biz-name',
-                           '[data-test*="business"]'
-                       ]
-                       
-                       for selector in business_selectors:
-                           businesses = soup.select(selector)
-                           
-                           for i, business in enumerate(businesses[:2]):
-                               try:
-                                   business_name = business.get_text(strip=True)
-                                   if business_name and len(business_name) > 3:
-                                       lead = Lead(
-                                           first_name="Local",
-                                           last_name=f"Owner{i+1}",
-                                           company_name=business_name,
-                                           title="Owner",
-                                           revenue="2000000",
-                                           industry="Services",
-                                           email=f"contact@{business_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
-                                           source="Google Maps Alternative"
-                                       )
-                                       leads.append(lead)
-                                       
-                                       if len(leads) >= 2:
-                                           break
-                               except Exception:
-                                   continue
-                           
-                           if len(leads) >= 2:
-                               break
-                       
-                       self.respect_rate_limits()
-                       
-                       if len(leads) >= 2:
-                           break
-                           
-               except Exception as e:
-                   print(f"Failed to scrape {base_url}: {e}")
+           # Try to access directory listings
+           for base_url, response in self.fetch_listings(directory_sources):
+               if response is None or response.status_code != 200:
                    continue
+               
+               # Extract business names
+               businesses = LISTING_EXTRACTORS['google_maps'].extract(response.content, limit=2 - len(leads))
+               
+               for i, business_name in businesses:
+                   lead = Lead(
+                       first_name="Local",
+                       last_name=f"Owner{i+1}",
+                       company_name=business_name,
+                       title="Owner",
+                       revenue="2000000",
+                       industry="Services",
+                       email=f"contact@{business_name.lower().replace(' ', '').replace(',', '')[:20]}.com",
+                       source="Google Maps Alternative"
+                   )
+                   leads.append(lead)
+               
+               if len(leads) >= 2:
+                   break
                    
        except Exception as e:
            print(f"Google Maps alternative scraping failed: {e}")
        
        return leads
    
-   def enrich_lead_with_website_data(self, lead: Lead) -> Lead:
-       """Enrich lead by scraping their company website"""
+   def prefetch_company_profiles(self, leads: List[Lead]) -> Dict[str, DomainOutcome]:
+       """Fetch every distinct company site for a batch concurrently over asyncio.
+       
+       Each page is reduced to its company profile as soon as it arrives, and
+       the outcomes go into the domain cache; domains it already knows are
+       not fetched again. Returns this batch's new outcomes by URL, or {}
+       when the async path is disabled or aiohttp is missing, in which case
+       enrichment fetches each domain on a worker thread.
+       """
+       if not (ASYNC_FETCH_ENABLED and AIOHTTP_AVAILABLE) or not leads:
+           return {}
+       urls = dict.fromkeys(company_website_url(lead.company_name) for lead in leads)
+       pending = [url for url in urls if self.domain_cache.get(url) is None]
+       results = fetch_all(
+           pending,
+           limit_per_host=self.per_host_limit,
+           timeout=5,
+           headers=dict(self.session.headers),
+           allow=self.check_robots_txt,
+           rate_limiter=self.rate_limiter,
+           response_cache=self.response_cache,
+           breaker=self.breaker,
+       ) if pending else []
+       outcomes = {}
+       for result in results:
+           if result.error:
+               print(f"Website enrichment failed for {result.url}: {result.error}")
+               outcome = DomainOutcome(result.url, result.error_kind or ERROR, error=result.error)
+           else:
+               outcome = self.company_outcome(Page(url=result.url, status_code=result.status_code, text=result.text))
+           self.domain_cache.put(outcome)
+           outcomes[result.url] = outcome
+       return outcomes
+   
+   def company_outcome(self, page: Page) -> DomainOutcome:
+       """Classify a fetched homepage, keeping only its extracted profile"""
+       profile = self.extract_company_profile(page) if page.status_code == 200 else None
+       return outcome_for_status(page.url, page.status_code, profile)
+   
+   def fetch_company_outcome(self, url: str) -> DomainOutcome:
+       """Fetch a company homepage and classify what happened"""
        try:
-           website_url = f"https://www.{lead.company_name.lower().replace(' ', '').replace(',', '')}.com"
-           
-           if not self.check_robots_txt(website_url):
-               return lead
-               
-           response = self.session.get(website_url, timeout=5)
-           if response.status_code == 200:
-               soup = BeautifulSoup(response.content, 'html.parser')
-               
-               # Extract contact information
-               emails = self.extract_emails_from_website(website_url)
-               if emails:
-                   lead.email = emails[0]
-               
-               lead.website = website_url
-               
-               # Try to extract phone numbers
-               phone_pattern = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-               phones = re.findall(phone_pattern, response.text)
-               if phones:
-                   lead.phone = phones[0]
-                   
+           with self.host_slot(url):
+               if not self.check_robots_txt(url):
+                   return DomainOutcome(url, DISALLOWED)
+               page = self.fetch_page(url)
        except Exception as e:
-           print(f"Website enrichment failed for {lead.company_name}: {e}")
-           
+           print(f"Website enrichment failed for {url}: {e}")
+           return DomainOutcome(url, classify_exception(e), error=str(e))
+       return self.company_outcome(page)
+   
+   def extract_company_profile(self, page: Page) -> CompanyProfile:
+       """Run the extractors once over a company's homepage.
+       
+       Extractors run against a blank probe lead; whatever fields they set
+       become the profile's updates, which fill the empty fields of every
+       contact at that company. Extractors therefore see only the page, not
+       the contact.
+       """
+       try:
+           probe = replace(BLANK_LEAD)
+           # Every extractor works off the same downloaded body
+           for extractor in self.extractors:
+               extractor(page, probe)
+           updates = {f.name: getattr(probe, f.name) for f in fields(Lead)
+                      if getattr(probe, f.name) != getattr(BLANK_LEAD, f.name)}
+           return CompanyProfile(website=page.url, updates=updates)
+       
+       except Exception as e:
+           print(f"Website enrichment failed for {page.url}: {e}")
+           return CompanyProfile()
+   
+   def company_profile(self, website_url: str, outcome: Optional[DomainOutcome] = None) -> CompanyProfile:
+       """A company's profile; each domain is fetched and extracted once per TTL"""
+       if outcome is None:
+           # Known-dead domains are skipped without touching the network
+           outcome = self.domain_cache.resolve(website_url, self.fetch_company_outcome)
+       return outcome.data if outcome.ok else CompanyProfile()
+   
+   def company_profiles(self, leads: List[Lead]) -> Dict[str, CompanyProfile]:
+       """Company stage of enrichment: one profile per distinct company domain in the batch"""
+       outcomes = self.prefetch_company_profiles(leads)
+       urls = list(dict.fromkeys(company_website_url(lead.company_name) for lead in leads))
+       if not urls:
+           return {}
+       
+       def profile(url: str) -> CompanyProfile:
+           return self.company_profile(url, outcomes.get(url))
+       
+       workers = min(self.max_workers, len(urls))
+       with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='company') as pool:
+           return dict(zip(urls, pool.map(profile, urls)))
+   
+   def enrich_lead_with_website_data(self, lead: Lead, profile: Optional[CompanyProfile] = None) -> Lead:
+       """Enrich lead from its company website (or an already computed company profile)"""
+       if profile is None:
+           profile = self.company_profile(company_website_url(lead.company_name))
+       profile.apply(lead)
        return lead
    
-   def enrich_lead(self, lead: Lead) -> Lead:
+   def enrich_lead(self, lead: Lead, profile: Optional[CompanyProfile] = None) -> Lead:
        """Enhanced lead enrichment with real website data"""
        # Try real website enrichment first
        try:
-           lead = self.enrich_lead_with_website_data(lead)
+           lead = self.enrich_lead_with_website_data(lead, profile)
        except Exception:
            pass
        
@@ -653,12 +757,14 @@ Caprae Capital Partners"""
        """Mock data enrichment for demo purposes"""
        time.sleep(0.1)
        
+       # Seeded per lead so results do not depend on worker scheduling
+       rng = random.Random(f"{lead.email}|{lead.company_name}")
        mock_data = {
-           "phone": f"+1-{random.randint(100,999)}-{random.randint(100,999)}-{random.randint(1000,9999)}",
+           "phone": f"+1-{rng.randint(100,999)}-{rng.randint(100,999)}-{rng.randint(1000,9999)}",
            "linkedin": f"https://linkedin.com/in/{lead.first_name.lower()}-{lead.last_name.lower()}",
-           "website": f"https://www.{lead.company_name.lower().replace(' ', '').replace(',', '')}.com",
-           "location": random.choice(["New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA"]),
-           "employees": random.choice(["10-50", "51-200", "201-500", "501-1000"])
+           "website": company_website_url(lead.company_name),
+           "location": rng.choice(["New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA"]),
+           "employees": rng.choice(["10-50", "51-200", "201-500", "501-1000"])
        }
        
        return mock_data
@@ -720,28 +826,157 @@ Caprae Capital Partners"""
        ]
        return gmaps_leads
    
-   def process_leads(self, leads: List[Lead]) -> List[Lead]:
-       """Process and score leads"""
-       processed = []
+   def process_leads(self, leads: List[Lead],
+                     on_processed: Optional[Callable[[Lead, str], None]] = None) -> List[Lead]:
+       """Process and score leads, enriching them concurrently.
+       
+       on_processed, if given, is called with each lead and the email it
+       arrived with (its dedup key; enrichment may fill in a company address)
+       as soon as it is done, in input order, so callers can publish partial
+       results.
+       """
+       unique_leads = []
        seen_emails = set()
        
        for lead in leads:
-           if lead.email in seen_emails:
+           # Skip repeats within the batch and leads already stored by earlier batches
+           if lead.email in seen_emails or self.store.contains_email(lead.email):
                continue
            seen_emails.add(lead.email)
-           
-           lead = self.enrich_lead(lead)
-           lead.score = self.calculate_score(lead)
-           lead.email_template = self.generate_personalized_email(lead)
-           lead.created_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-           
-           processed.append(lead)
+           unique_leads.append(lead)
+       
+       if not unique_leads:
+           return []
+       
+       # Company-level work (fetch + extraction) runs once per company domain;
+       # the per-contact stage only copies the results onto each lead
+       profiles = self.company_profiles(unique_leads)
+       
+       def process(lead: Lead) -> Lead:
+           return self.process_single_lead(lead, profiles.get(company_website_url(lead.company_name)))
+       
+       # Captured before enrichment can change them
+       ingested_emails = [lead.email for lead in unique_leads]
+       
+       # map() yields results in input order, so the output does not depend on
+       # which worker finishes first; the sort below is stable as well
+       workers = min(self.max_workers, len(unique_leads))
+       with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enrich') as pool:
+           processed = []
+           for lead, email in zip(pool.map(process, unique_leads), ingested_emails):
+               processed.append(lead)
+               if on_processed is not None:
+                   on_processed(lead, email)
        
        processed.sort(key=lambda x: x.score, reverse=True)
        return processed
+   
+   def process_single_lead(self, lead: Lead, profile: Optional[CompanyProfile] = None) -> Lead:
+       """Enrich, score and pick the template for a single lead"""
+       lead = self.enrich_lead(lead, profile)
+       lead.score = self.calculate_score(lead)
+       # Only the template id is kept; the email is rendered when requested
+       lead.template_id = APP_TEMPLATES.template_id(lead.score)
+       lead.created_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+       return lead
 
-# Initialize global processor
+# Initialize global processor and background job queue
 processor = LeadProcessor()
+job_queue = JobQueue(max_workers=JOB_WORKERS, max_results=JOB_MAX_RESULTS)
+
+class StoreWriter:
+   """on_processed callback: stores leads in batches and publishes them on a job"""
+   
+   def __init__(self, job, batch_size: int = STORE_BATCH_SIZE):
+       self.job = job
+       self.batch_size = max(1, batch_size)
+       self.pending: List[Lead] = []
+       self.pending_emails: List[str] = []
+       self.stored = 0
+   
+   def __call__(self, lead: Lead, email: str) -> None:
+       self.job.advance()
+       self.pending.append(lead)
+       self.pending_emails.append(email)
+       if len(self.pending) >= self.batch_size:
+           self.flush()
+   
+   def flush(self) -> None:
+       if not self.pending:
+           return
+       # One transaction per batch; leads that arrived with an already stored
+       # email are skipped (the same key process_leads deduplicates on)
+       for lead in processor.store.add_many(self.pending, self.pending_emails):
+           self.job.add_result(asdict(lead))
+           self.stored += 1
+       processor.add_processed(len(self.pending))
+       self.pending = []
+       self.pending_emails = []
+
+def run_scrape_job(job, sources: List[str], queries: List[str]) -> str:
+   """Background job: scrape sources in parallel, processing each one's leads as they arrive"""
+   writer = StoreWriter(job)
+   
+   def on_leads(source: str, leads: List[Lead]) -> None:
+       job.add_total(len(leads))
+       processed = processor.process_leads(leads, on_processed=writer)
+       # Rows skipped as duplicates are done too
+       job.advance(len(leads) - len(processed))
+       writer.flush()
+   
+   processor.scrape_many(sources, queries, on_leads=on_leads)
+   
+   return f'Successfully scraped {writer.stored} leads from {", ".join(sources)}'
+
+def lead_from_row(row: Dict[str, str]) -> Lead:
+   """Build a Lead from an uploaded CSV row"""
+   return Lead(
+       first_name=row.get('first_name', ''),
+       last_name=row.get('last_name', ''),
+       company_name=row.get('company_name', ''),
+       title=row.get('title', ''),
+       revenue=row.get('revenue', ''),
+       industry=row.get('industry', ''),
+       email=row.get('email', ''),
+       phone=row.get('phone', ''),
+       source='CSV Upload'
+   )
+
+def iter_csv_batches(path: str, batch_rows: int = UPLOAD_BATCH_ROWS):
+   """Yield lists of at most batch_rows Leads, decoding and parsing lazily"""
+   with open(path, encoding='utf-8-sig', newline='') as stream:
+       reader = csv.DictReader(stream)
+       while True:
+           batch = [lead_from_row(row) for row in islice(reader, batch_rows)]
+           if not batch:
+               return
+           yield batch
+
+def run_upload_job(job, path: str) -> str:
+   """Background job: stream a spooled CSV upload through enrich, score and store"""
+   writer = StoreWriter(job)
+   try:
+       for batch in iter_csv_batches(path):
+           job.add_total(len(batch))
+           processed = processor.process_leads(batch, on_processed=writer)
+           # Rows skipped as duplicates are done too
+           job.advance(len(batch) - len(processed))
+           # Flush per batch so results appear, and later batches dedup
+           # against them, before the rest of the file is read
+           writer.flush()
+   finally:
+       os.remove(path)
+   
+   return f'Successfully processed {writer.stored} leads from CSV'
+
+def job_accepted(job):
+   """202 response pointing the client at the job status endpoint"""
+   return jsonify({
+       'success': True,
+       'job_id': job.id,
+       'status': job.status,
+       'status_url': f'/api/jobs/{job.id}'
+   }), 202
 
 @app.route('/')
 def dashboard():
@@ -750,26 +985,26 @@ def dashboard():
 
 @app.route('/api/scrape', methods=['POST'])
 def scrape_leads():
-   """API endpoint for scraping leads from various sources"""
-   data = request.get_json()
-   source = data.get('source', 'apollo')
-   query = data.get('query', '')
+   """Queue a scrape job; returns a job id immediately.
+   
+   Accepts source/query, or sources/queries lists to fan out over every
+   combination at once.
+   """
+   data = request.get_json() or {}
+   sources = data.get('sources') or [data.get('source', 'apollo')]
+   queries = data.get('queries') or [data.get('query', '')]
    
-   time.sleep(1)
+   if not isinstance(sources, list) or not isinstance(queries, list) or \
+         not all(isinstance(value, str) for value in sources + queries):
+       return jsonify({'success': False, 'error': 'sources and queries must be lists of strings'}), 400
+   sources = list(dict.fromkeys(sources))
+   queries = list(dict.fromkeys(queries))
+   if len(sources) * len(queries) > SCRAPE_MAX_PAIRS:
+       return jsonify({'success': False, 'error': f'At most {SCRAPE_MAX_PAIRS} source/query combinations per request'}), 400
    
    try:
-       scraped_leads = processor.scrape_real_leads(source, query)
-       processed_leads = processor.process_leads(scraped_leads)
-       
-       processor.leads.extend(processed_leads)
-       processor.processed_count += len(processed_leads)
-       
-       return jsonify({
-           'success': True,
-           'leads': [asdict(lead) for lead in processed_leads],
-           'count': len(processed_leads),
-           'message': f'Successfully scraped {len(processed_leads)} leads from {source}'
-       })
+       job = job_queue.submit('scrape', run_scrape_job, sources, queries)
+       return job_accepted(job)
    
    except Exception as e:
        return jsonify({
@@ -779,7 +1014,7 @@ def scrape_leads():
 
 @app.route('/api/upload', methods=['POST'])
 def upload_csv():
-   """Upload and process CSV file"""
+   """Upload a CSV file and queue it for processing"""
    if 'file' not in request.files:
        return jsonify({'success': False, 'error': 'No file uploaded'}), 400
    
@@ -788,32 +1023,14 @@ def upload_csv():
        return jsonify({'success': False, 'error': 'No file selected'}), 400
    
    try:
-       stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-       csv_input = csv.DictReader(stream)
-       
-       leads = []
-       for row in csv_input:
-           lead = Lead(
-               first_name=row.get('first_name', ''),
-               last_name=row.get('last_name', ''),
-               company_name=row.get('company_name', ''),
-               title=row.get('title', ''),
-               revenue=row.get('revenue', ''),
-               industry=row.get('industry', ''),
-               email=row.get('email', ''),
-               phone=row.get('phone', ''),
-               source='CSV Upload'
-           )
-           leads.append(lead)
+       # Spool the body to our own temp file (copied in fixed-size chunks) so
+       # the job can parse it incrementally after this request has finished
+       fd, path = tempfile.mkstemp(prefix='caprae_upload_', suffix='.csv')
+       with os.fdopen(fd, 'wb') as spool:
+           file.save(spool)
        
-       processed_leads = processor.process_leads(leads)
-       processor.leads.extend(processed_leads)
-       
-       return jsonify({
-           'success': True,
-           'leads': [asdict(lead) for lead in processed_leads],
-           'count': len(processed_leads)
-       })
+       job = job_queue.submit('upload', run_upload_job, path)
+       return job_accepted(job)
    
    except Exception as e:
        return jsonify({
@@ -821,64 +1038,193 @@ def upload_csv():
            'error': f'Error processing file: {str(e)}'
        }), 500
 
+@app.route('/api/jobs')
+def list_jobs():
+   """List recent background jobs without their results"""
+   return jsonify({
+       'jobs': [job.to_dict(include_results=False) for job in job_queue.list()]
+   })
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+   """Job status, progress and results; ?since=N returns only newer results
+   
+   Only the newest JOB_MAX_RESULTS results are kept; older ones are counted
+   in results_dropped and can be read from /api/leads.
+   """
+   job = job_queue.get(job_id)
+   if job is None:
+       return jsonify({'success': False, 'error': 'Job not found'}), 404
+   
+   since = request.args.get('since', 0, type=int)
+   return jsonify(job.to_dict(since=max(0, since)))
+
+LEAD_FIELDS = [f.name for f in fields(Lead)]
+
+# Computed on request rather than stored; selectable like any other field
+RENDERED_FIELDS: Dict[str, Callable[[Lead], str]] = {
+   'email_template': processor.render_email
+}
+
+def lead_to_dict(lead: Lead, selected: Optional[List[str]] = None) -> Dict:
+   """Shallow dict of a lead's fields (all stored ones, or just the selected ones)"""
+   return {
+       name: RENDERED_FIELDS[name](lead) if name in RENDERED_FIELDS else getattr(lead, name)
+       for name in (selected or LEAD_FIELDS)
+   }
+
+def encode_cursor(lead: Lead) -> str:
+   """Opaque keyset cursor pointing just after lead in score order"""
+   return base64.urlsafe_b64encode(f'{lead.score}:{lead.id}'.encode()).decode()
+
+def decode_cursor(cursor: str):
+   score, lead_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+   return int(score), int(lead_id)
+
 @app.route('/api/leads')
 def get_leads():
-   """Get all processed leads with filtering"""
+   """Page through processed leads, best score first, with filtering.
+   
+   ?limit= and ?cursor= page by keyset (pass back next_cursor); ?fields=
+   is a comma-separated projection. Unchanged pages answer 304 via ETag.
+   """
    min_score = request.args.get('min_score', 0, type=int)
    industry = request.args.get('industry', '')
    source = request.args.get('source', '')
+   limit = request.args.get('limit', LEADS_PAGE_SIZE, type=int)
+   cursor = request.args.get('cursor', '')
+   field_list = request.args.get('fields', '')
    
-   filtered_leads = processor.leads
+   limit = max(1, min(limit, LEADS_MAX_PAGE_SIZE))
+   selected = None
+   if field_list:
+       selected = [name.strip() for name in field_list.split(',') if name.strip()]
+       unknown = [name for name in selected if name not in LEAD_FIELDS and name not in RENDERED_FIELDS]
+       if unknown:
+           return jsonify({'success': False, 'error': f'Unknown fields: {", ".join(unknown)}'}), 400
+       if 'id' not in selected:
+           selected.insert(0, 'id')
    
-   if min_score > 0:
-       filtered_leads = [lead for lead in filtered_leads if lead.score >= min_score]
+   try:
+       after = decode_cursor(cursor) if cursor else None
+   except (ValueError, UnicodeDecodeError):
+       return jsonify({'success': False, 'error': 'Invalid cursor'}), 400
    
-   if industry:
-       filtered_leads = [lead for lead in filtered_leads if industry.lower() in lead.industry.lower()]
+   # The store version changes on every add/delete, so it plus the query
+   # string identifies the response body
+   etag = hashlib.sha1(f'{processor.store.version}|{request.query_string.decode()}'.encode()).hexdigest()
+   if etag in request.if_none_match:
+       response = Response(status=304)
+       response.set_etag(etag)
+       return response
    
-   if source:
-       filtered_leads = [lead for lead in filtered_leads if source.lower() in lead.source.lower()]
+   page = processor.store.query(min_score=min_score, industry=industry, source=source,
+                                limit=limit + 1, after=after)
+   has_more = len(page) > limit
+   page = page[:limit]
    
-   return jsonify({
-       'leads': [asdict(lead) for lead in filtered_leads],
-       'total_count': len(processor.leads),
-       'filtered_count': len(filtered_leads)
+   response = jsonify({
+       'leads': [lead_to_dict(lead, selected) for lead in page],
+       'total_count': len(processor.store),
+       'filtered_count': processor.store.count(min_score=min_score, industry=industry, source=source),
+       'next_cursor': encode_cursor(page[-1]) if has_more else None
    })
+   response.set_etag(etag)
+   return response
+
+@app.route('/api/leads/<int:lead_id>')
+def get_lead(lead_id):
+   """Full record for a single lead, including its rendered email"""
+   lead = processor.store.get(lead_id)
+   if lead is None:
+       return jsonify({'success': False, 'error': 'Lead not found'}), 404
+   return jsonify(lead_to_dict(lead, LEAD_FIELDS + list(RENDERED_FIELDS)))
+
+@app.route('/api/emails', methods=['POST'])
+def render_emails():
+   """Render the outreach emails for a batch of lead ids"""
+   data = request.get_json(silent=True) or {}
+   lead_ids = data.get('ids', [])
+   if not isinstance(lead_ids, list) or not all(isinstance(i, int) for i in lead_ids):
+       return jsonify({'success': False, 'error': 'ids must be a list of lead ids'}), 400
+   if len(lead_ids) > LEADS_MAX_PAGE_SIZE:
+       return jsonify({'success': False, 'error': f'At most {LEADS_MAX_PAGE_SIZE} ids per request'}), 400
+   
+   emails = []
+   missing = []
+   for lead_id in lead_ids:
+       lead = processor.store.get(lead_id)
+       if lead is None:
+           missing.append(lead_id)
+           continue
+       emails.append({
+           'id': lead.id,
+           'template_id': lead.template_id,
+           'email_template': processor.render_email(lead)
+       })
+   
+   return jsonify({'success': True, 'emails': emails, 'missing': missing})
+
+EXPORT_FIELDS = [
+   'first_name', 'last_name', 'company_name', 'title', 'revenue', 
+   'industry', 'email', 'phone', 'linkedin_url', 'website', 
+   'location', 'employees', 'source', 'score', 'created_date'
+]
+
+def iter_export_csv(leads):
+   """Yield the export CSV as encoded chunks, one bounded buffer at a time"""
+   buffer = io.StringIO()
+   writer = csv.writer(buffer)
+   writer.writerow(EXPORT_FIELDS)
+   # Send the header straight away so the download starts immediately
+   yield buffer.getvalue().encode()
+   buffer.seek(0)
+   buffer.truncate(0)
+   
+   for lead in leads:
+       writer.writerow([getattr(lead, field) for field in EXPORT_FIELDS])
+       if buffer.tell() >= EXPORT_CHUNK_BYTES:
+           yield buffer.getvalue().encode()
+           buffer.seek(0)
+           buffer.truncate(0)
+   
+   if buffer.tell():
+       yield buffer.getvalue().encode()
+
+def gzip_chunks(chunks):
+   """Gzip-compress a stream of byte chunks incrementally"""
+   compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+   for chunk in chunks:
+       data = compressor.compress(chunk)
+       if data:
+           yield data
+   yield compressor.flush()
 
 @app.route('/api/export')
 def export_leads():
-   """Export leads to CSV"""
-   output = io.StringIO()
-   fieldnames = [
-       'first_name', 'last_name', 'company_name', 'title', 'revenue', 
-       'industry', 'email', 'phone', 'linkedin_url', 'website', 
-       'location', 'employees', 'source', 'score', 'created_date'
-   ]
-   
-   writer = csv.DictWriter(output, fieldnames=fieldnames)
-   writer.writeheader()
-   
-   for lead in processor.leads:
-       row = asdict(lead)
-       row.pop('email_template', None)
-       row.pop('enriched', None)
-       writer.writerow(row)
-   
-   output.seek(0)
-   
-   return send_file(
-       io.BytesIO(output.getvalue().encode()),
-       mimetype='text/csv',
-       as_attachment=True,
-       download_name=f'caprae_leads_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+   """Stream leads as CSV; ?compress=gzip returns a .csv.gz"""
+   compress = request.args.get('compress', '') == 'gzip'
+   filename = f'caprae_leads_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+   
+   body = iter_export_csv(processor.store)
+   mimetype = 'text/csv'
+   if compress:
+       body = gzip_chunks(body)
+       mimetype = 'application/gzip'
+       filename += '.gz'
+   
+   return Response(
+       body,
+       mimetype=mimetype,
+       headers={'Content-Disposition': f'attachment; filename={filename}'}
    )
 
 @app.route('/api/clear', methods=['DELETE'])
 def clear_data():
    """Clear all lead data"""
    try:
-       processor.leads.clear()
-       processor.processed_count = 0
+       processor.store.clear()
+       processor.reset_processed()
        
        return jsonify({
            'success': True,
@@ -891,12 +1237,12 @@ def clear_data():
            'error': f'Error clearing data: {str(e)}'
        }), 500
 
-@app.route('/api/delete-lead/<int:lead_index>', methods=['DELETE'])
-def delete_single_lead(lead_index):
-   """Delete a single lead by index"""
+@app.route('/api/delete-lead/<int:lead_id>', methods=['DELETE'])
+def delete_single_lead(lead_id):
+   """Delete a single lead by id"""
    try:
-       if 0 <= lead_index < len(processor.leads):
-           deleted_lead = processor.leads.pop(lead_index)
+       deleted_lead = processor.store.delete(lead_id)
+       if deleted_lead is not None:
            return jsonify({
                'success': True,
                'message': f'Lead {deleted_lead.first_name} {deleted_lead.last_name} deleted successfully'
@@ -915,24 +1261,18 @@ def delete_single_lead(lead_index):
 
 @app.route('/api/bulk-delete', methods=['DELETE'])
 def bulk_delete_leads():
-   """Delete multiple leads by their indices"""
-   data = request.get_json()
-   indices = data.get('indices', [])
+   """Delete multiple leads by their ids"""
+   data = request.get_json() or {}
+   ids = data.get('ids', [])
    
-   if not indices:
+   if not ids:
        return jsonify({
            'success': False,
-           'error': 'No lead indices provided'
+           'error': 'No lead ids provided'
        }), 400
    
    try:
-       indices.sort(reverse=True)
-       deleted_count = 0
-       
-       for index in indices:
-           if 0 <= index < len(processor.leads):
-               processor.leads.pop(index)
-               deleted_count += 1
+       deleted_count = len(processor.store.delete_many(ids))
        
        return jsonify({
            'success': True,
@@ -949,9 +1289,9 @@ def bulk_delete_leads():
 @app.route('/api/stats')
 def get_stats():
    """Get dashboard statistics"""
-   leads = processor.leads
+   stats = processor.store.stats()
    
-   if not leads:
+   if not stats['total']:
        return jsonify({
            'total_leads': 0,
            'avg_score': 0,
@@ -960,35 +1300,18 @@ def get_stats():
            'score_distribution': {}
        })
    
-   total_leads = len(leads)
-   avg_score = sum(lead.score for lead in leads) / total_leads
-   
-   industry_counts = {}
-   for lead in leads:
-       industry_counts[lead.industry] = industry_counts.get(lead.industry, 0) + 1
-   top_industries = sorted(industry_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-   
-   source_counts = {}
-   for lead in leads:
-       source_counts[lead.source] = source_counts.get(lead.source, 0) + 1
-   
-   score_ranges = {'0-10': 0, '11-15': 0, '16-20': 0, '21+': 0}
-   for lead in leads:
-       if lead.score <= 10:
-           score_ranges['0-10'] += 1
-       elif lead.score <= 15:
-           score_ranges['11-15'] += 1
-       elif lead.score <= 20:
-           score_ranges['16-20'] += 1
-       else:
-           score_ranges['21+'] += 1
+   total_leads = stats['total']
+   avg_score = stats['score_sum'] / total_leads
+   # Top-k over the distinct industries only; nsmallest is stable, so ties
+   # keep first-seen order as the old sorted(...)[:5] did
+   top_industries = heapq.nsmallest(5, stats['industry_counts'].items(), key=lambda x: -x[1])
    
    return jsonify({
        'total_leads': total_leads,
        'avg_score': round(avg_score, 1),
        'top_industries': top_industries,
-       'source_breakdown': source_counts,
-       'score_distribution': score_ranges
+       'source_breakdown': stats['source_counts'],
+       'score_distribution': stats['score_distribution']
    })
 
 if __name__ == '__main__':
@@ -0,0 +1,176 @@
+"""
+async_fetch.py
+==============
+
+Optional asyncio HTTP client for fetching many pages at once.
+
+Thread-per-request fetching tops out at a few dozen requests in flight. This
+module drives them from one event loop over a pooled aiohttp connector
+instead: connections are kept alive and reused, the number of open
+connections is capped both overall and per host, and every request has a
+connect and total timeout. Politeness hooks are the same ones the
+``requests`` path uses: an ``allow(url)`` predicate (robots.txt), a
+``HostRateLimiter`` whose reservations are awaited instead of slept, an
+optional ``ResponseCache`` that fresh pages are served from and 200s are
+stored in, and an optional ``transport.CircuitBreaker`` that skips hosts
+which keep failing.
+
+aiohttp is optional; check ``AIOHTTP_AVAILABLE`` and fall back to the
+synchronous session when it is missing. Nothing here depends on Flask, so
+both app.py and lead_tool.py can use it.
+
+Usage:
+    results = fetch_all(urls, limit_per_host=2, timeout=5)
+    # or, inside a coroutine:
+    async with AsyncFetcher() as fetcher:
+        results = await fetcher.fetch_many(urls)
+"""
+
+import asyncio
+import os
+import socket
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from domain_cache import CIRCUIT_OPEN, CONNECT_ERROR, DISALLOWED, DNS_FAILURE, ERROR, TIMEOUT
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+
+DEFAULT_LIMIT = int(os.environ.get("ASYNC_FETCH_LIMIT", "200"))
+DEFAULT_LIMIT_PER_HOST = int(os.environ.get("ASYNC_FETCH_PER_HOST", "2"))
+DEFAULT_TIMEOUT = float(os.environ.get("ASYNC_FETCH_TIMEOUT", "5"))
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one fetch; status_code is 0 when no response was received.
+
+    error_kind classifies failures with the domain_cache status names.
+    """
+    url: str
+    status_code: int
+    text: str
+    error: str = ""
+    from_cache: bool = False
+    error_kind: str = ""
+
+
+def classify_error(exc: BaseException) -> str:
+    """domain_cache status for an aiohttp/socket failure."""
+    if isinstance(exc, aiohttp.ClientConnectorError):
+        if isinstance(exc.os_error, socket.gaierror):
+            return DNS_FAILURE
+        return CONNECT_ERROR
+    if isinstance(exc, socket.gaierror):
+        return DNS_FAILURE
+    return ERROR
+
+
+class AsyncFetcher:
+    """Pooled aiohttp session with per-host limits and politeness hooks."""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 timeout: float = DEFAULT_TIMEOUT, headers: Optional[Dict[str, str]] = None,
+                 allow: Optional[Callable[[str], bool]] = None, rate_limiter=None,
+                 response_cache=None, breaker=None):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is not installed")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.allow = allow
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.breaker = breaker
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout, sock_connect=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+        self._session = None
+
+    def _cached(self, url: str) -> Optional[FetchResult]:
+        if self.response_cache is None:
+            return None
+        entry = self.response_cache.get(url)
+        if entry is None or not self.response_cache.is_fresh(entry):
+            return None
+        return FetchResult(url, entry.status_code, entry.body.decode("utf-8", errors="replace"),
+                           from_cache=True)
+
+    async def fetch(self, url: str) -> FetchResult:
+        """GET url politely; errors are reported in the result, not raised."""
+        host = urlparse(url).netloc.lower()
+        try:
+            # robots.txt lookups are cached per host and may block on a first fetch
+            if self.allow is not None and not await asyncio.to_thread(self.allow, url):
+                return FetchResult(url, 0, "", error="disallowed by robots.txt", error_kind=DISALLOWED)
+            cached = self._cached(url)
+            if cached is not None:
+                return cached
+            if self.breaker is not None and not self.breaker.allow(host):
+                return FetchResult(url, 0, "", error=f"circuit open for {host}", error_kind=CIRCUIT_OPEN)
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(url)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with self._session.get(url) as response:
+                body = await response.read()
+                text = body.decode(response.charset or "utf-8", errors="replace")
+                if (self.response_cache is not None and response.status == 200
+                        and "no-store" not in response.headers.get("Cache-Control", "")):
+                    self.response_cache.put(url, response.status, dict(response.headers), body)
+                self._record(host, response.status < 500 and response.status != 429)
+                return FetchResult(url, response.status, text)
+        except asyncio.TimeoutError:
+            self._record(host, False)
+            return FetchResult(url, 0, "", error="timeout", error_kind=TIMEOUT)
+        except Exception as e:
+            self._record(host, False)
+            return FetchResult(url, 0, "", error=str(e) or type(e).__name__, error_kind=classify_error(e))
+
+    def _record(self, host: str, ok: bool) -> None:
+        if self.breaker is None:
+            return
+        if ok:
+            self.breaker.record_success(host)
+        else:
+            self.breaker.record_failure(host)
+
+    async def fetch_many(self, urls: Sequence[str]) -> List[FetchResult]:
+        """Fetch all urls concurrently; results are in the same order."""
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+
+def fetch_all(urls: Sequence[str], **fetcher_kwargs) -> List[FetchResult]:
+    """Synchronous entry point: run fetch_many on a private event loop.
+
+    Must be called from a thread with no running loop (a worker thread, a
+    background job or a script).
+    """
+    async def run() -> List[FetchResult]:
+        async with AsyncFetcher(**fetcher_kwargs) as fetcher:
+            return await fetcher.fetch_many(urls)
+
+    return asyncio.run(run())
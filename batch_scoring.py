@@ -0,0 +1,120 @@
+"""
+batch_scoring.py
+================
+
+Vectorised lead scoring over columnar data with NumPy.
+
+The per-lead scorers (``LeadProcessor.calculate_score`` in app.py and
+``score_lead`` in lead_tool.py) stay the reference; these functions compute
+exactly the same integers for a whole column at once:
+
+* titles and industries are factorised, scored once per distinct value with
+  the compiled rulesets, and mapped back through a lookup table;
+* revenue strings are parsed once per distinct value into a float64 column
+  and bucketed with vectorised comparisons;
+* the enrichment bonus is a weighted sum of boolean columns.
+
+NumPy is optional: check ``NUMPY_AVAILABLE`` and fall back to the per-lead
+scorers when it is missing.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from scoring_rules import (
+    APP_INDUSTRY_RULES,
+    APP_TITLE_RULES,
+    TOOL_INDUSTRY_RULES,
+    TOOL_TITLE_RULES,
+    parse_app_revenue,
+    parse_tool_revenue,
+)
+
+
+def factorize(values: Sequence[Any]) -> Tuple["np.ndarray", List[Any]]:
+    """Integer codes into a list of distinct values (first-seen order)."""
+    index: Dict[Any, int] = dict.fromkeys(values)
+    for code, value in enumerate(index):
+        index[value] = code
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.intp, count=len(values))
+    return codes, list(index)
+
+
+def map_distinct(values: Sequence[Any], fn: Callable[[Any], Any], dtype) -> "np.ndarray":
+    """fn applied once per distinct value, broadcast back to every row."""
+    codes, uniques = factorize(values)
+    table = np.array([fn(value) for value in uniques], dtype=dtype)
+    return table[codes]
+
+
+def app_revenue_points_vec(revenues: Sequence[str]) -> "np.ndarray":
+    """Vectorised scoring_rules.app_revenue_points(parse_app_revenue(...))."""
+    codes, uniques = factorize(revenues)
+    parsed = [parse_app_revenue(value) for value in uniques]
+    failed = np.array([value is None for value in parsed], dtype=bool)[codes]
+    rev = np.array([np.nan if value is None else value for value in parsed], dtype=np.float64)[codes]
+    # Same order as the scalar if/elif chain; NaN matches nothing and gets 2
+    points = np.select(
+        [
+            (rev >= 10_000_000) & (rev <= 100_000_000),
+            (rev >= 5_000_000) & (rev < 10_000_000),
+            (rev >= 1_000_000) & (rev < 5_000_000),
+            rev > 100_000_000,
+        ],
+        [10, 8, 6, 4],
+        default=2,
+    )
+    return np.where(failed, 1, points)
+
+
+def tool_revenue_points_vec(revenues: Sequence[str]) -> "np.ndarray":
+    """Vectorised lead_tool._score_revenue."""
+    rev = map_distinct(revenues, parse_tool_revenue, np.float64)
+    return np.select(
+        [rev >= 500e6, rev >= 100e6, rev >= 10e6, rev >= 1e6],
+        [5, 4, 3, 2],
+        default=1,
+    )
+
+
+def score_app_batch(titles: Sequence[str], revenues: Sequence[str], industries: Sequence[str],
+                    has_phone: Sequence[bool], has_linkedin: Sequence[bool],
+                    has_website: Sequence[bool]) -> "np.ndarray":
+    """LeadProcessor.calculate_score for whole columns; returns an int64 array.
+
+    The has_* columns are booleans (or 0/1): whether the lead has a phone,
+    LinkedIn URL and website.
+    """
+    title_points = map_distinct(titles, APP_TITLE_RULES.score, np.int64)
+    industry_points = map_distinct(industries, APP_INDUSTRY_RULES.score, np.int64)
+    revenue_points = app_revenue_points_vec(revenues)
+    bonus = (2 * np.asarray(has_phone, dtype=np.int64)
+             + 2 * np.asarray(has_linkedin, dtype=np.int64)
+             + np.asarray(has_website, dtype=np.int64))
+    return title_points + revenue_points + industry_points + bonus
+
+
+def score_tool_batch(titles: Sequence[str], revenues: Sequence[str],
+                     industries: Sequence[str]) -> "np.ndarray":
+    """lead_tool title + revenue + industry score for whole columns."""
+    return (map_distinct(titles, TOOL_TITLE_RULES.score, np.int64)
+            + tool_revenue_points_vec(revenues)
+            + map_distinct(industries, TOOL_INDUSTRY_RULES.score, np.int64))
+
+
+def lead_columns(leads: Sequence[Any]) -> Dict[str, List[Any]]:
+    """Columnar view of app.py Leads in the shape score_app_batch expects."""
+    return {
+        "titles": [lead.title for lead in leads],
+        "revenues": [lead.revenue for lead in leads],
+        "industries": [lead.industry for lead in leads],
+        "has_phone": [bool(lead.phone) for lead in leads],
+        "has_linkedin": [bool(lead.linkedin_url) for lead in leads],
+        "has_website": [bool(lead.website) for lead in leads],
+    }
@@ -0,0 +1,91 @@
+"""
+bench_batch_scoring.py
+======================
+
+Compare per-lead scoring (``LeadProcessor.calculate_score`` and lead_tool's
+``score_lead`` arithmetic) with the NumPy column scorers in batch_scoring.py.
+
+The script first checks the batch results equal the per-lead results on a
+randomised lead list, including revenue strings that fail to parse, then
+times both paths.
+
+Usage:
+    python benchmarks/bench_batch_scoring.py [--leads 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app import Lead, processor  # noqa: E402
+from batch_scoring import NUMPY_AVAILABLE, lead_columns, score_app_batch, score_tool_batch  # noqa: E402
+from bench_scoring import INDUSTRIES, TITLES  # noqa: E402
+from lead_tool import _score_industry, _score_revenue, _score_title  # noqa: E402
+
+REVENUES = [
+    "$25M", "$5M", "$1,500,000", "$100M", "$2B", "750000", "10000000", "$9.5M",
+    "small", "medium", "large", "Large ", "unknown", "", "N/A", "nan", "1e8", "-5M",
+]
+
+
+def random_leads(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        Lead(
+            first_name="", last_name="", company_name="",
+            title=rng.choice(TITLES),
+            revenue=rng.choice(REVENUES) if rng.random() < 0.9 else f"${rng.randint(0, 500)}M",
+            industry=rng.choice(INDUSTRIES),
+            email="",
+            phone="555-0100" if rng.random() < 0.5 else "",
+            linkedin_url="https://linkedin.com/x" if rng.random() < 0.3 else "",
+            website="https://example.com" if rng.random() < 0.7 else "",
+        )
+        for _ in range(count)
+    ]
+
+
+def tool_score(lead) -> int:
+    return _score_title(lead.title) + _score_revenue(lead.revenue) + _score_industry(lead.industry)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorised batch scoring benchmark")
+    parser.add_argument("--leads", type=int, default=1000000)
+    args = parser.parse_args()
+    if not NUMPY_AVAILABLE:
+        sys.exit("NumPy is not installed")
+
+    sample = random_leads(50000, seed=0)
+    assert score_app_batch(**lead_columns(sample)).tolist() == [processor.calculate_score(l) for l in sample]
+    assert score_tool_batch(*(lead_columns(sample)[k] for k in ("titles", "revenues", "industries"))).tolist() \
+        == [tool_score(l) for l in sample]
+    print("equivalence: ok")
+
+    leads = random_leads(args.leads, seed=1)
+
+    start = time.perf_counter()
+    old = [processor.calculate_score(lead) for lead in leads]
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = lead_columns(leads)
+    gather_time = time.perf_counter() - start
+    new = score_app_batch(**columns)
+    new_time = time.perf_counter() - start
+    assert new.tolist() == old
+
+    per_lead = 1e9 / args.leads
+    print(f"{args.leads} leads, app composite score")
+    print(f"  calculate_score loop  {old_time * per_lead:8.0f} ns/lead")
+    print(f"  lead_columns + batch  {new_time * per_lead:8.0f} ns/lead  ({old_time / new_time:.1f}x)")
+    print(f"  score_app_batch only  {(new_time - gather_time) * per_lead:8.0f} ns/lead"
+          f"  ({old_time / (new_time - gather_time):.1f}x, columns already gathered)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+bench_contact_extract.py
+========================
+
+Compare the previous contact extraction (one ``re.findall`` per pattern over
+the whole page, then nested ``any()`` filtering) with the single-pass
+scanner in contact_extract.py on synthetic company homepages of increasing
+size, with contacts in the footer.
+
+The script first checks a set of regression cases (lookalike hosts such
+as ``my-linkedin.com``, trailing punctuation after social links, addresses
+the old filter kept or dropped) and fuzzes both paths with random strings.
+It then checks both paths find the same emails and phones on every page
+when the new scanner is not capped, and times the old path, the uncapped
+scanner and the default capped one.
+
+Results are compared with the raw output of the old path. The only
+differences allowed are the two contact_extract.py makes on purpose: image
+names such as ``feature@2x.png`` are not emails, and ``example.com`` /
+``test.com`` only block addresses at those domains, so an address the old
+substring check dropped (``sales@test.community``) may be kept.
+
+Usage:
+    python benchmarks/bench_contact_extract.py [--repeat 20] [--fuzz 20000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from contact_extract import DEFAULT_SCAN_LIMIT, extract_contacts  # noqa: E402
+
+# The patterns app.py passed to re.findall before contact_extract existed
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+PHONE_PATTERN = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+ASSET_NAME = re.compile(r'\.(png|jpe?g|gif|svg|webp|ico|css|js)$', re.IGNORECASE)
+
+
+def old_extract(text: str):
+    """The previous find_emails + phone findall, verbatim in behaviour."""
+    emails = list(set(re.findall(EMAIL_PATTERN, text)))
+    emails = [email for email in emails if not any(
+        skip in email.lower() for skip in ['example.com', 'test.com', 'placeholder']
+    )]
+    phones = re.findall(PHONE_PATTERN, text)
+    return emails, phones
+
+
+def make_page(sections: int) -> str:
+    """A homepage with scripts, navigation, content sections and a contact footer."""
+    parts = ["<html><head><title>Acme Corp</title>",
+             "<script>window.__STATE__ = {" + ",".join(f'"k{i}": [{i}, {i * 7}, "v{i}"]'
+                                                      for i in range(200)) + "};</script>",
+             "<style>.hero { margin: 0 auto; } .card { padding: 4px; }</style></head><body>",
+             "<nav>" + "".join(f'<a href="/products/{i}">Product {i}</a>' for i in range(40)) + "</nav>"]
+    for i in range(sections):
+        parts.append(
+            f'<section class="feature" id="feature-{i}"><h2>Feature {i}</h2>'
+            f'<p>Our platform helps teams of {i % 50 + 5} people ship faster, with '
+            f'<a href="/docs/feature-{i}">documentation</a> and 24/7 support.</p>'
+            f'<img src="/static/img/feature-{i}@2x.png" alt="Feature {i}"></section>'
+        )
+    parts.append(
+        '<footer><p>Acme Corp, 100 Main Street</p>'
+        '<p>Sales: <a href="mailto:sales@acmecorp.com">sales@acmecorp.com</a> '
+        'Support: support@acmecorp.com Placeholder: you@example.com</p>'
+        '<p>Call (555) 123-4567 or 555.987.6543</p>'
+        '<a href="https://www.linkedin.com/company/acmecorp">LinkedIn</a> '
+        '<a href="https://twitter.com/acmecorp">Twitter</a></footer></body></html>'
+    )
+    return "".join(parts)
+
+
+# Text around lookalike social hosts; none of these are social links, and the
+# contacts next to them must still be found
+LOOKALIKE_CASES = [
+    ("visit my-linkedin.com/page or mail a@b.io", ["a@b.io"], []),
+    ("+x.com/foo call 555-123-4567", [], ["555-123-4567"]),
+    ("x:https://twitter-x.com/y sales@acme.io", ["sales@acme.io"], []),
+]
+
+
+# (text, emails, phones, social links) the new scanner must return
+REGRESSION_CASES = [
+    ("email@acme.com or name@acme.com", ["email@acme.com", "name@acme.com"], [], {}),
+    ("sales@Placeholder.io _x@y.com", ["_x@y.com"], [], {}),
+    ("a@b.co.x@c.io", ["a@b.co", ".x@c.io"], [], {}),
+    ("a@555.123.4567.io", ["a@555.123.4567.io"], ["555.123.4567"], {}),
+    ("see twitter.com/joe, or (linkedin.com/in/joe).", [], [],
+     {"twitter": "twitter.com/joe", "linkedin": "linkedin.com/in/joe"}),
+    ("https://github.com/acme/5551234567 hi@acme.io; hi@acme.io", ["hi@acme.io"], ["5551234567"],
+     {"github": "https://github.com/acme/5551234567"}),
+]
+# Tokens the fuzzer strings are built from
+FUZZ_TOKENS = ["@", ".", "_", "-", "+", "%", " ", "(", ")", "/", ",", ";", ":", "\n", '"', "com", "io",
+               "png", "Placeholder", "example", "test", "community", "x", "linkedin", "twitter", "email",
+               "a", "Z", "\u00e9", "\u0663", "555", "123", "4567", "1", "2x", "www.", "mailto:"]
+
+
+def check_cases():
+    for text, emails, phones in LOOKALIKE_CASES:
+        contacts = extract_contacts(text)
+        assert contacts.emails == emails and contacts.phones == phones, (text, contacts)
+        assert not contacts.social_links, (text, contacts)
+    for text, emails, phones, social_links in REGRESSION_CASES:
+        contacts = extract_contacts(text)
+        assert (contacts.emails, contacts.phones, contacts.social_links) == (emails, phones, social_links), \
+            (text, contacts)
+
+
+def check_same_as_old(text: str, contacts) -> None:
+    """The scanner's emails and phones are the old path's, apart from the intended differences."""
+    old_emails, old_phones = old_extract(text)
+    old_emails, new_emails = set(old_emails), set(contacts.emails)
+    assert len(new_emails) == len(contacts.emails), contacts
+    assert all(ASSET_NAME.search(email) for email in old_emails - new_emails), (text, contacts)
+    assert all(any(skip in email.lower() for skip in ["example.com", "test.com"])
+               for email in new_emails - old_emails), (text, contacts)
+    assert contacts.phones == old_phones, (text, contacts, old_phones)
+
+
+def check_fuzz(samples: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for _ in range(samples):
+        text = "".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 40)))
+        check_same_as_old(text, extract_contacts(text, limit=len(text)))
+
+
+def timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact extraction benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fuzz", type=int, default=20000, help="random strings to compare")
+    args = parser.parse_args()
+    check_cases()
+    check_fuzz(args.fuzz)
+    print(f"{len(LOOKALIKE_CASES) + len(REGRESSION_CASES)} cases and {args.fuzz} fuzz strings match")
+
+    print(f"{'sections':>8} {'KB':>7} {'old ms':>9} {'full ms':>9} {'capped ms':>10} {'speedup':>8}")
+    for sections in (100, 1000, 10000, 50000):
+        page = make_page(sections)
+        full = extract_contacts(page, limit=len(page))
+        check_same_as_old(page, full)
+        capped = extract_contacts(page)
+        assert capped.emails == full.emails and capped.phones == full.phones, capped
+
+        repeat = max(1, args.repeat * 1000 // sections)
+        old = timeit(lambda: old_extract(page), repeat)
+        new_full = timeit(lambda: extract_contacts(page, limit=len(page)), repeat)
+        new = timeit(lambda: extract_contacts(page), repeat)
+        print(f"{sections:>8} {len(page) / 1024:>7.0f} {old * 1000:>9.2f} "
+              f"{new_full * 1000:>9.2f} {new * 1000:>10.2f} {old / new:>7.1f}x")
+    print(f"scan limit: {DEFAULT_SCAN_LIMIT // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+bench_parse.py
+==============
+
+Compare the old BeautifulSoup(html.parser) + soup.select listing extraction
+with the precompiled lxml path in html_extract.py on synthetic directory
+pages of increasing size.
+
+Usage:
+    python benchmarks/bench_parse.py [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from html_extract import LISTING_EXTRACTORS  # noqa: E402
+
+# The selectors the scrapers used with soup.select before html_extract existed
+CSS_SELECTORS = {
+    "apollo": ['a[href*="/organization/"]', ".company-name", ".org-name", '[data-test*="company"]'],
+    "google_maps": [".business-name", ".biz-name", '[data-test*="business"]'],
+}
+
+
+def make_page(cards: int) -> bytes:
+    """A directory-like page with navigation chrome, scripts and listing cards."""
+    parts = ["<html><head><title>Directory</title>",
+             "<script>var config = {a: 1, b: [1, 2, 3]};</script>",
+             "<style>.card { color: red; }</style></head><body>",
+             "<nav>" + "".join(f'<a href="/nav/{i}">Nav {i}</a>' for i in range(50)) + "</nav>"]
+    for i in range(cards):
+        parts.append(
+            f'<div class="card result" data-id="{i}">'
+            f'<a class="listing-link company-name" href="/organization/company-{i}">'
+            f'<span>Company</span> <b>Number {i}</b></a>'
+            f'<p class="desc">Description for company {i} with <em>markup</em> and text.</p>'
+            f'<div class="business-name" data-test="business-card">Business {i} LLC</div>'
+            f'<ul><li>Tag A</li><li>Tag B</li><li>Tag C</li></ul></div>'
+        )
+    parts.append("<footer>" + "<p>footer text</p>" * 20 + "</footer></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def soup_extract(content: bytes, selectors, limit: int):
+    """The previous scraper loop, verbatim in behaviour."""
+    soup = BeautifulSoup(content, "html.parser")
+    found = []
+    for selector in selectors:
+        for i, element in enumerate(soup.select(selector)[:2]):
+            name = element.get_text(strip=True)
+            if name and len(name) > 3:
+                found.append((i, name))
+                if len(found) >= limit:
+                    return found
+    return found
+
+
+def timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listing parse benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'source':<12} {'cards':>6} {'KB':>7} {'bs4 ms':>9} {'lxml ms':>9} {'speedup':>8}")
+    for source, limit in (("apollo", 3), ("google_maps", 2)):
+        extractor = LISTING_EXTRACTORS[source]
+        for cards in (50, 500, 5000):
+            page = make_page(cards)
+            expected = soup_extract(page, CSS_SELECTORS[source], limit)
+            actual = extractor.extract(page, limit)
+            assert actual == expected, (actual, expected)
+
+            repeat = max(1, args.repeat * 50 // cards)
+            old = timeit(lambda: soup_extract(page, CSS_SELECTORS[source], limit), repeat)
+            new = timeit(lambda: extractor.extract(page, limit), repeat)
+            print(f"{source:<12} {cards:>6} {len(page) / 1024:>7.0f} "
+                  f"{old * 1000:>9.2f} {new * 1000:>9.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
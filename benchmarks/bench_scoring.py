@@ -0,0 +1,166 @@
+"""
+bench_scoring.py
+================
+
+Compare the original ``any(key in text ...)`` title/industry scoring chains
+with the compiled, memoised rulesets in scoring_rules.py.
+
+The reference implementations below are the pre-ruleset code from app.py.
+The script first checks both paths agree on a randomised corpus, then times
+them on a lead list where titles and industries repeat, as real lists do.
+
+Usage:
+    python benchmarks/bench_scoring.py [--leads 200000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scoring_rules import (  # noqa: E402
+    APP_INDUSTRY_RULES, APP_TITLE_RULES, TOOL_INDUSTRY_RULES, TOOL_TITLE_RULES,
+)
+
+
+def reference_app_title(title: str) -> int:
+    title_lower = title.lower()
+    if any(key in title_lower for key in ["ceo", "chief executive", "founder", "president"]):
+        return 10
+    if any(key in title_lower for key in ["cfo", "chief financial"]):
+        return 9
+    if any(key in title_lower for key in ["cto", "chief technology", "chief technical"]):
+        return 8
+    if any(key in title_lower for key in ["vp", "vice president", "svp"]):
+        return 7
+    if any(key in title_lower for key in ["director", "head of"]):
+        return 5
+    if any(key in title_lower for key in ["manager", "lead"]):
+        return 3
+    return 1
+
+
+def reference_app_industry(industry: str) -> int:
+    industry_lower = industry.lower()
+    if any(key in industry_lower for key in ["saas", "software", "technology", "fintech"]):
+        return 8
+    if any(key in industry_lower for key in ["subscription", "membership", "recurring"]):
+        return 7
+    if any(key in industry_lower for key in ["healthcare", "education", "consulting"]):
+        return 6
+    if any(key in industry_lower for key in ["manufacturing", "logistics", "distribution"]):
+        return 4
+    return 2
+
+
+def reference_tool_title(title: str) -> int:
+    title_lower = title.lower()
+    if any(key in title_lower for key in ["ceo", "chief executive"]):
+        return 5
+    if any(key in title_lower for key in ["cfo", "chief financial"]):
+        return 5
+    if any(key in title_lower for key in ["cto", "chief technology"]):
+        return 4
+    if any(key in title_lower for key in ["vp", "vice president"]):
+        return 3
+    if any(key in title_lower for key in ["manager", "director"]):
+        return 2
+    return 1
+
+
+def reference_tool_industry(industry: str) -> int:
+    industry_lower = industry.lower()
+    if any(key in industry_lower for key in ["technology", "software"]):
+        return 4
+    if any(key in industry_lower for key in ["health", "biotech"]):
+        return 3
+    if any(key in industry_lower for key in ["manufacturing", "industrial"]):
+        return 2
+    return 1
+
+
+TITLES = [
+    "CEO", "Chief Executive Officer", "Founder & CEO", "Co-Founder", "President",
+    "CFO", "Chief Financial Officer", "CTO", "Chief Technical Officer", "VP Sales",
+    "SVP Engineering", "Vice President of Marketing", "Director of Operations",
+    "Head of Growth", "Engineering Manager", "Team Lead", "Account Executive",
+    "Software Engineer", "Sales Representative", "Operations Analyst",
+    "Senior Vice President, Strategy & Corporate Development", "Principal",
+]
+INDUSTRIES = [
+    "SaaS", "Software", "Technology", "Fintech", "Subscription Boxes",
+    "Membership Organizations", "Healthcare", "Healthcare Tech", "Education",
+    "Consulting", "Manufacturing", "Logistics & Distribution", "Biotech",
+    "Industrial Automation", "E-commerce", "Retail", "Services", "Marketing Tech",
+]
+PAIRS = [
+    (reference_app_title, APP_TITLE_RULES, TITLES),
+    (reference_app_industry, APP_INDUSTRY_RULES, INDUSTRIES),
+    (reference_tool_title, TOOL_TITLE_RULES, TITLES),
+    (reference_tool_industry, TOOL_INDUSTRY_RULES, INDUSTRIES),
+]
+
+
+def random_text(rng: random.Random, vocabulary) -> str:
+    """Mix vocabulary fragments and noise so keywords overlap and straddle."""
+    parts = [rng.choice(vocabulary)[rng.randint(0, 3):] for _ in range(rng.randint(1, 3))]
+    noise = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz &-") for _ in range(rng.randint(0, 6)))
+    return rng.choice([" ", "", "/"]).join(parts) + noise
+
+
+def check_equivalence(samples: int = 20000) -> None:
+    rng = random.Random(0)
+    for reference, rules, vocabulary in PAIRS:
+        for _ in range(samples):
+            text = random_text(rng, vocabulary)
+            assert reference(text) == rules.score(text), (reference.__name__, text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Title/industry scoring benchmark")
+    parser.add_argument("--leads", type=int, default=200000)
+    args = parser.parse_args()
+
+    check_equivalence()
+    print("equivalence: ok")
+
+    rng = random.Random(1)
+    titles = [rng.choice(TITLES) for _ in range(args.leads)]
+    industries = [rng.choice(INDUSTRIES) for _ in range(args.leads)]
+
+    start = time.perf_counter()
+    old = [reference_app_title(t) + reference_app_industry(i) for t, i in zip(titles, industries)]
+    old_time = time.perf_counter() - start
+
+    APP_TITLE_RULES.score.cache_clear()
+    APP_INDUSTRY_RULES.score.cache_clear()
+    start = time.perf_counter()
+    new = [APP_TITLE_RULES.score(t) + APP_INDUSTRY_RULES.score(i) for t, i in zip(titles, industries)]
+    new_time = time.perf_counter() - start
+    assert old == new
+
+    # Worst case for the rulesets: every string distinct, so nothing is memoised
+    unique = [f"{t} {n}" for n, t in enumerate(titles)]
+    start = time.perf_counter()
+    for text in unique:
+        reference_app_title(text)
+    old_unique = time.perf_counter() - start
+    start = time.perf_counter()
+    for text in unique:
+        APP_TITLE_RULES._score(text)
+    new_unique = time.perf_counter() - start
+
+    per_lead = 1e9 / args.leads
+    print(f"{args.leads} leads, title + industry")
+    print(f"  any() chains      {old_time * per_lead:8.0f} ns/lead")
+    print(f"  compiled+memo     {new_time * per_lead:8.0f} ns/lead  ({old_time / new_time:.1f}x)")
+    print(f"{args.leads} distinct titles, no memoisation")
+    print(f"  any() chains      {old_unique * per_lead:8.0f} ns/lead")
+    print(f"  compiled regex    {new_unique * per_lead:8.0f} ns/lead  ({old_unique / new_unique:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
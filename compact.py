@@ -0,0 +1,33 @@
+"""
+compact.py
+==========
+
+Helpers for keeping large numbers of Lead records small in memory.
+
+* ``DATACLASS_SLOTS`` turns on ``__slots__`` for a dataclass on Python 3.10+
+  (no per-instance ``__dict__``); on older interpreters it is a no-op.
+* ``intern_fields`` replaces low-cardinality string fields (industry, title,
+  source, ...) with the interned copy, so a million leads share a handful of
+  string objects instead of each holding its own copy from the CSV parser.
+
+Usage:
+    @dataclass(**DATACLASS_SLOTS)
+    class Lead:
+        industry: str
+
+        def __post_init__(self):
+            intern_fields(self, ("industry",))
+"""
+
+import sys
+from typing import Any, Dict, Sequence
+
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def intern_fields(obj: Any, names: Sequence[str]) -> None:
+    """Swap each named str attribute of obj for its interned equivalent."""
+    for name in names:
+        value = getattr(obj, name)
+        if type(value) is str:
+            setattr(obj, name, sys.intern(value))
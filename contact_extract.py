@@ -0,0 +1,178 @@
+"""
+contact_extract.py
+==================
+
+Single-pass extraction of contact details from a company web page.
+
+Enrichment used to run one ``re.findall`` over the whole page for emails,
+another for phone numbers, and then filter the emails with nested ``any()``
+substring checks. This module scans the decoded text once with one compiled
+pattern that finds emails, phone numbers and social profile links together:
+
+* Only the first ``limit`` characters are scanned (the last ``tail`` of
+  them taken from the end of the page, where footers keep contact details),
+  so a multi-megabyte page costs no more than a normal one. Byte bodies are
+  cut before they are decoded.
+* Emails and phone numbers are the ones the previous ``re.findall`` calls
+  returned, with two deliberate exceptions: asset names such as
+  ``logo@2x.png`` are not emails, and ``example.com`` / ``test.com`` are
+  blocked as the domain or a parent domain (a set lookup per label) rather
+  than anywhere in the address, so ``sales@test.community`` is kept.
+  Addresses containing "placeholder" are still dropped.
+* Results keep page order. Emails are de-duplicated exactly as the old
+  ``set()`` did; phones are every match, as ``findall`` returned them.
+
+Usage:
+    contacts = extract_contacts(page.text)
+    contacts.emails, contacts.phones, contacts.social_links
+"""
+
+import os
+import re
+import string
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
+
+DEFAULT_SCAN_LIMIT = int(os.environ.get("CONTACT_SCAN_LIMIT", "524288"))
+DEFAULT_SCAN_TAIL = int(os.environ.get("CONTACT_SCAN_TAIL", "65536"))
+
+# Emails at these domains (or their subdomains) are placeholders, not contacts
+BLOCKED_EMAIL_DOMAINS = frozenset({"example.com", "test.com"})
+# "name@2x.png" style asset names match the email pattern
+BLOCKED_EMAIL_TLDS = frozenset({
+    "png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "css", "js",
+})
+# Dropped wherever it appears in the address, case-insensitively
+BLOCKED_EMAIL_SUBSTRING = "placeholder"
+
+# Social profile hosts (all <label>.com) and the network they are reported under
+SOCIAL_NETWORKS: Dict[str, str] = {
+    "linkedin.com": "linkedin",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "facebook.com": "facebook",
+    "instagram.com": "instagram",
+    "youtube.com": "youtube",
+    "github.com": "github",
+}
+SOCIAL_LABELS: Dict[str, str] = {host[:-len(".com")]: network for host, network in SOCIAL_NETWORKS.items()}
+
+# Every branch starts from a character that is rare in markup compared with
+# letters -- the "@" of an email, the "(" or first digit of a phone number,
+# the "." before a social host's "com/" -- and the match is extended or
+# walked back from there. Starting the whole pattern with one character class
+# lets the regex engine skip everything else without trying each branch at
+# each position. Emails and social links consume only their anchor (the rest
+# is captured in a lookahead), so phone numbers and emails inside them are
+# still found, as they were by separate findall calls. A social link never
+# ends in punctuation, so "twitter.com/acme," yields "twitter.com/acme".
+CONTACT_BRANCHES = (
+    r"(?:"
+    r"(?<=@)(?=([A-Za-z0-9.-]+\.[A-Za-z]{2,}\b))"
+    r"|(?<=\()\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+    r"|(?<=\d)\d\d\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+    r"|(?<=\.)(?:" + "|".join(r"(?<=\b(?i:%s)\.)" % re.escape(label) for label in SOCIAL_LABELS) + r")"
+    r"(?=((?i:com)/[^\s\"'<>()]*[^\s\"'<>().,;:]))"
+    r")"
+)
+CONTACT_PATTERN = re.compile(r"[@(.\d]" + CONTACT_BRANCHES)
+# The same pattern for ASCII text; a leading class without the Unicode \d
+# category is matched much faster, and on ASCII text \d is [0-9] anyway
+ASCII_CONTACT_PATTERN = re.compile(r"[@(.0-9]" + CONTACT_BRANCHES)
+
+LOCAL_PART_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+URL_STOP_CHARS = frozenset(" \t\r\n\"'<>()=")
+# How far back from the anchor a URL prefix may start
+MAX_URL_PREFIX = 32
+
+
+@dataclass
+class ContactInfo:
+    """Contacts found on one page, in page order; social_links keeps the first link per network."""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    social_links: Dict[str, str] = field(default_factory=dict)
+
+
+def is_blocked_email(email: str) -> bool:
+    key = email.lower()
+    if BLOCKED_EMAIL_SUBSTRING in key:
+        return True
+    labels = key.rpartition("@")[2].split(".")
+    if labels[-1] in BLOCKED_EMAIL_TLDS:
+        return True
+    return any(".".join(labels[i:]) in BLOCKED_EMAIL_DOMAINS for i in range(len(labels) - 1))
+
+
+def scan_window(text: Union[str, bytes], limit: int = DEFAULT_SCAN_LIMIT,
+                tail: int = DEFAULT_SCAN_TAIL) -> str:
+    """The part of the page that is scanned: its head plus its tail, decoded."""
+    if len(text) > limit:
+        tail = min(tail, limit)
+        head = text[:limit - tail]
+        end = text[len(text) - tail:] if tail else text[:0]
+        text = head + (b"\n" if isinstance(text, bytes) else "\n") + end
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    return text
+
+
+def _walk_back(text: str, pos: int, chars, floor: int, inside: bool) -> int:
+    """Start of the run ending at pos whose characters are (or, if not inside, are not) in chars."""
+    start = pos
+    while start > floor and (text[start - 1] in chars) is inside:
+        start -= 1
+    return start
+
+
+def _is_word(char: str) -> bool:
+    # What \w matches in a str pattern
+    return char.isalnum() or char == "_"
+
+
+def _local_part_start(text: str, start: int, anchor: int) -> int:
+    """First position in text[start:anchor] where a leading \\b would match, or anchor if none."""
+    before = start > 0 and _is_word(text[start - 1])
+    while start < anchor:
+        word = _is_word(text[start])
+        if word is not before:
+            break
+        before = word
+        start += 1
+    return start
+
+
+def extract_contacts(text: Union[str, bytes], limit: int = DEFAULT_SCAN_LIMIT,
+                     tail: int = DEFAULT_SCAN_TAIL) -> ContactInfo:
+    """Emails, phone numbers and social links from one pass over the page."""
+    text = scan_window(text, limit, tail)
+    contacts = ContactInfo()
+    seen_emails = set()
+    # Where the last email ended; like findall, the next one cannot start before it
+    email_end = 0
+    pattern = ASCII_CONTACT_PATTERN if text.isascii() else CONTACT_PATTERN
+    for match in pattern.finditer(text):
+        anchor = match.start()
+        kind = text[anchor]
+        if kind == "@":
+            start = _walk_back(text, anchor, LOCAL_PART_CHARS, email_end, True)
+            start = _local_part_start(text, start, anchor)
+            if start == anchor:
+                continue
+            email_end = anchor + 1 + len(match.group(1))
+            email = text[start:email_end]
+            if email not in seen_emails:
+                seen_emails.add(email)
+                if not is_blocked_email(email):
+                    contacts.emails.append(email)
+        elif kind == ".":
+            start = _walk_back(text, anchor, URL_STOP_CHARS, max(0, anchor - MAX_URL_PREFIX), False)
+            label = text[start:anchor].lower().rpartition("/")[2].rpartition(".")[2]
+            # The pattern only checks the label's word boundary, so hosts such
+            # as my-linkedin.com get here too; only real social hosts count
+            network = SOCIAL_LABELS.get(label)
+            if network is not None:
+                contacts.social_links.setdefault(network, text[start:anchor + 1] + match.group(2))
+        else:
+            contacts.phones.append(match.group())
+    return contacts
@@ -0,0 +1,190 @@
+"""
+domain_cache.py
+===============
+
+Shared, TTL-bounded memory of what happened the last time a company domain
+was fetched for enrichment.
+
+Enrichment guesses ``https://www.<company>.com`` for every lead, so many
+leads hit the same domain and many guesses do not exist. Each domain's
+outcome is recorded once -- resolved, DNS failure, timeout, connection
+error, HTTP error or disallowed by robots.txt -- and reused by every later
+lead until it expires. Dead domains are skipped immediately instead of
+costing another lookup or timeout, and concurrent leads for the same domain
+wait for a single fetch rather than each starting their own.
+
+A resolved outcome carries whatever the caller extracted from the page
+(``data``), never the page body itself: thousands of cached homepages would
+otherwise sit in memory, and the body is in the on-disk response cache
+anyway.
+
+Failures that are likely to be transient (timeouts, refused connections,
+429 and 5xx responses) expire sooner than definite answers.
+
+Usage:
+    outcome = domain_cache.resolve(url, fetch_outcome)
+    if outcome.ok:
+        use(outcome.data)
+"""
+
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+RESOLVED = "resolved"
+DNS_FAILURE = "dns_failure"
+TIMEOUT = "timeout"
+CONNECT_ERROR = "connect_error"
+HTTP_ERROR = "http_error"
+HTTP_TRANSIENT = "http_transient"
+DISALLOWED = "disallowed"
+CIRCUIT_OPEN = "circuit_open"
+ERROR = "error"
+
+DEFAULT_TTL = float(os.environ.get("DOMAIN_CACHE_TTL", "3600"))
+DEFAULT_DEAD_TTL = float(os.environ.get("DOMAIN_CACHE_DEAD_TTL", "21600"))
+DEFAULT_RETRY_TTL = float(os.environ.get("DOMAIN_CACHE_RETRY_TTL", "600"))
+DEFAULT_MAX_ENTRIES = int(os.environ.get("DOMAIN_CACHE_MAX_ENTRIES", "4096"))
+
+
+@dataclass
+class DomainOutcome:
+    """Result of one fetch of a domain's page; data is what was extracted from a resolved page."""
+    url: str
+    status: str
+    status_code: int = 0
+    data: Any = None
+    error: str = ""
+    checked_at: float = field(default_factory=time.time)
+
+    @property
+    def ok(self) -> bool:
+        return self.status == RESOLVED
+
+
+def classify_exception(exc: BaseException) -> str:
+    """Map a requests/urllib3/socket exception to an outcome status."""
+    seen = set()
+    pending = [exc]
+    while pending:
+        error = pending.pop()
+        if error is None or id(error) in seen:
+            continue
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror) or type(error).__name__ == "NameResolutionError":
+            return DNS_FAILURE
+        if isinstance(error, (requests.exceptions.Timeout, socket.timeout, TimeoutError)):
+            return TIMEOUT
+        # urllib3 wraps the root cause in MaxRetryError.reason
+        pending.extend([getattr(error, "reason", None), error.__cause__, error.__context__])
+        pending.extend(arg for arg in getattr(error, "args", ()) if isinstance(arg, BaseException))
+    if type(exc).__name__ == "CircuitOpenError":
+        return CIRCUIT_OPEN
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return CONNECT_ERROR
+    return ERROR
+
+
+def outcome_for_status(url: str, status_code: int, data: Any = None) -> DomainOutcome:
+    if status_code == 200:
+        return DomainOutcome(url, RESOLVED, status_code, data)
+    if status_code == 429 or status_code >= 500:
+        return DomainOutcome(url, HTTP_TRANSIENT, status_code)
+    return DomainOutcome(url, HTTP_ERROR, status_code)
+
+
+class DomainCache:
+    """Per-domain outcomes with status-dependent TTLs and single-flight fetches."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, dead_ttl: float = DEFAULT_DEAD_TTL,
+                 retry_ttl: float = DEFAULT_RETRY_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.ttls: Dict[str, float] = {
+            RESOLVED: ttl,
+            HTTP_ERROR: ttl,
+            DISALLOWED: ttl,
+            DNS_FAILURE: dead_ttl,
+            HTTP_TRANSIENT: retry_ttl,
+            TIMEOUT: retry_ttl,
+            CONNECT_ERROR: retry_ttl,
+            ERROR: retry_ttl,
+            # The circuit breaker already decides when to try again
+            CIRCUIT_OPEN: 0,
+        }
+        self._entries: "OrderedDict[str, DomainOutcome]" = OrderedDict()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _fresh(self, key: str) -> Optional[DomainOutcome]:
+        """Lock held."""
+        outcome = self._entries.get(key)
+        if outcome is None:
+            return None
+        if time.time() - outcome.checked_at >= self.ttls.get(outcome.status, 0):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return outcome
+
+    def get(self, url: str) -> Optional[DomainOutcome]:
+        with self._lock:
+            return self._fresh(self.key(url))
+
+    def put(self, outcome: DomainOutcome) -> None:
+        if not self.ttls.get(outcome.status, 0):
+            return
+        key = self.key(outcome.url)
+        with self._lock:
+            self._entries[key] = outcome
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def resolve(self, url: str, fetch: Callable[[str], DomainOutcome]) -> DomainOutcome:
+        """Cached outcome for url's domain, fetching it (once) if needed.
+
+        Concurrent callers for the same domain wait for the first one's
+        fetch instead of issuing their own.
+        """
+        key = self.key(url)
+        with self._lock:
+            outcome = self._fresh(key)
+            if outcome is not None:
+                return outcome
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = threading.Event()
+        if not owner:
+            event.wait()
+            with self._lock:
+                outcome = self._fresh(key)
+            # None when the outcome was not cacheable or the fetch raised
+            return outcome if outcome is not None else fetch(url)
+        try:
+            outcome = fetch(url)
+            self.put(outcome)
+            return outcome
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
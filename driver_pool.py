@@ -0,0 +1,186 @@
+"""
+driver_pool.py
+==============
+
+Bounded pool of reusable Selenium WebDriver instances.
+
+Starting headless Chrome costs seconds and hundreds of MB, so scrapes lease a
+warm driver from the pool instead of launching one per call. At most
+``max_size`` browsers exist at once; a driver is health-checked before each
+lease and recycled (quit and replaced on demand) once it has served
+``max_pages`` pages, its JS heap grows past ``max_heap_mb``, or a scrape using
+it raised an error.
+
+Usage:
+    pool = DriverPool(factory=make_chrome, max_size=2)
+    with pool.lease() as driver:
+        driver.get(url)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_HEAP_MB = 512
+
+
+class DriverUnavailable(Exception):
+    """Raised when no WebDriver could be started or leased."""
+
+
+class _PooledDriver:
+    __slots__ = ("driver", "pages", "created_at")
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """Thread-safe pool of at most max_size live WebDrivers."""
+
+    def __init__(self, factory: Callable[[], Any], max_size: int = DEFAULT_POOL_SIZE,
+                 max_pages: int = DEFAULT_MAX_PAGES, max_heap_mb: float = DEFAULT_MAX_HEAP_MB):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_pages = max_pages
+        self.max_heap_bytes = max_heap_mb * 1024 * 1024
+        self._idle: List[_PooledDriver] = []
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _create(self) -> _PooledDriver:
+        driver = self.factory()
+        if driver is None:
+            raise DriverUnavailable("WebDriver factory returned no driver")
+        return _PooledDriver(driver)
+
+    @staticmethod
+    def _quit(pooled: _PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _healthy(pooled: _PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _heap_bytes(self, pooled: _PooledDriver) -> Optional[float]:
+        """Chrome's used JS heap size, when the browser exposes it."""
+        try:
+            return pooled.driver.execute_script(
+                "return window.performance && performance.memory ? "
+                "performance.memory.usedJSHeapSize : null"
+            )
+        except Exception:
+            return None
+
+    def _needs_recycle(self, pooled: _PooledDriver) -> bool:
+        if self.max_pages and pooled.pages >= self.max_pages:
+            return True
+        heap = self._heap_bytes(pooled)
+        return heap is not None and heap > self.max_heap_bytes
+
+    def warm(self, count: int = 1) -> int:
+        """Start drivers ahead of time until count are idle; returns how many started.
+
+        Slots are held for the whole call, and a driver is only started while
+        fewer drivers are idle than slots held, so concurrent leases never
+        push the number of live browsers past max_size.
+        """
+        started = 0
+        held = 0
+        try:
+            for _ in range(min(count, self.max_size)):
+                if self._closed or not self._slots.acquire(blocking=False):
+                    break
+                held += 1
+                with self._lock:
+                    if len(self._idle) >= held:
+                        continue
+                try:
+                    pooled = self._create()
+                except Exception:
+                    break
+                with self._lock:
+                    if not self._closed:
+                        self._idle.append(pooled)
+                        pooled = None
+                if pooled is not None:
+                    self._quit(pooled)
+                    break
+                started += 1
+        finally:
+            for _ in range(held):
+                self._slots.release()
+        return started
+
+    def _checkout(self, timeout: Optional[float]) -> _PooledDriver:
+        if self._closed:
+            raise DriverUnavailable("Driver pool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverUnavailable("Timed out waiting for a WebDriver")
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    return self._create()
+                if self._healthy(pooled):
+                    return pooled
+                self._quit(pooled)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, pooled: _PooledDriver, failed: bool) -> None:
+        try:
+            pooled.pages += 1
+            if failed or self._closed or self._needs_recycle(pooled):
+                self._quit(pooled)
+                return
+            try:
+                pooled.driver.delete_all_cookies()
+            except Exception:
+                self._quit(pooled)
+                return
+            with self._lock:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Borrow a driver for the duration of the with-block."""
+        pooled = self._checkout(timeout)
+        failed = False
+        try:
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._checkin(pooled, failed)
+
+    def close(self) -> None:
+        """Quit all idle drivers; leased ones are quit when returned."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
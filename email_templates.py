@@ -0,0 +1,149 @@
+"""
+email_templates.py
+==================
+
+Outreach email templates, compiled once and rendered per lead.
+
+A template is plain text with ``{field}`` placeholders naming Lead attributes
+(or one of the derived fields in ``DERIVED_FIELDS``). At import time each
+template is compiled once into a function of the lead, so rendering is a few
+attribute reads and one string build. A ``TemplateSet`` picks the template
+for a lead from its already computed score; only that template is rendered.
+
+To change the wording or the score thresholds, edit the tables below.
+
+Usage:
+    from email_templates import APP_TEMPLATES
+    lead.email_template = APP_TEMPLATES.render(lead, lead.score)
+"""
+
+import string
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Placeholders computed from the lead rather than read off it, as Python
+# expressions over ``lead``
+DERIVED_FIELDS: Dict[str, str] = {
+    "industry_lower": "lead.industry.lower()",
+}
+
+
+class EmailTemplate:
+    """One template, compiled to a Python function of the lead.
+
+    The text becomes a single f-string expression (literal chunks are
+    repr()'d, placeholders become attribute reads), so rendering costs the
+    same as the hand-written f-strings it replaces.
+    """
+
+    def __init__(self, template_id: str, text: str):
+        self.template_id = template_id
+        self.text = text
+        names: List[str] = []
+        chunks: List[str] = []
+        for literal, field, spec, conversion in string.Formatter().parse(text):
+            if literal:
+                chunks.append(repr(literal))
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                raise ValueError(f"Unsupported placeholder {{{field}}} in template {template_id}")
+            if field not in names:
+                names.append(field)
+            chunks.append("f'{%s}'" % DERIVED_FIELDS.get(field, "lead." + field))
+        self.fields = tuple(names)
+        source = "lambda lead: " + (" ".join(chunks) or "''")
+        self.render: Callable[[Any], str] = eval(compile(source, f"<template {template_id}>", "eval"), {})
+
+
+class TemplateSet:
+    """Templates plus the score thresholds that choose between them.
+
+    thresholds is a list of (min_score, template_id) pairs checked in order;
+    the first one the score reaches wins, otherwise default is used.
+    """
+
+    def __init__(self, templates: Sequence[EmailTemplate],
+                 thresholds: Sequence[Tuple[int, str]], default: str):
+        self.templates = {template.template_id: template for template in templates}
+        self.thresholds = list(thresholds)
+        self.default = default
+        for template_id in [default] + [template_id for _, template_id in self.thresholds]:
+            if template_id not in self.templates:
+                raise ValueError(f"Unknown template id: {template_id}")
+
+    def template_id(self, score: int) -> str:
+        for min_score, template_id in self.thresholds:
+            if score >= min_score:
+                return template_id
+        return self.default
+
+    def get(self, template_id: str) -> Optional[EmailTemplate]:
+        return self.templates.get(template_id)
+
+    def render(self, lead: Any, score: Optional[int] = None) -> str:
+        """Render the template chosen by score (default: lead.score)."""
+        if score is None:
+            score = lead.score
+        return self.templates[self.template_id(score)].render(lead)
+
+
+# Flask app (app.py): tone by composite score
+APP_TEMPLATES = TemplateSet([
+    EmailTemplate("high_exec", """Subject: Quick chat about {company_name}'s growth trajectory
+
+Hi {first_name},
+
+Hope you're doing well. As {title} at {company_name}, you're probably focused on scaling operations and exploring strategic opportunities.
+
+At Caprae Capital, we specialize in partnering with {industry_lower} companies like yours to accelerate growth through our operator-first approach. Rather than just capital, we bring hands-on operational expertise.
+
+Would you be open to a brief conversation about {company_name}'s growth plans?
+
+Best regards,
+[Your Name]
+Caprae Capital Partners"""),
+
+    EmailTemplate("mid_level", """Subject: Operational efficiency insights for {company_name}
+
+Hi {first_name},
+
+I came across {company_name} and was impressed by your position in the {industry_lower} space.
+
+As {title}, you likely see firsthand the operational challenges that come with growth. At Caprae Capital, we've helped similar companies streamline operations and unlock new opportunities through our SaaS and M&A-as-a-Service models.
+
+Would you be interested in a quick call to discuss how we could support {company_name}'s operational goals?
+
+Best,
+[Your Name]
+Caprae Capital"""),
+
+    EmailTemplate("standard", """Subject: Partnership opportunity for {company_name}
+
+Hello {first_name},
+
+I hope this message finds you well. I'm reaching out because {company_name} caught our attention as an innovative player in the {industry_lower} sector.
+
+At Caprae Capital, we focus on empowering businesses through strategic partnerships and operational support. Our unique approach combines capital with hands-on expertise to help companies achieve sustainable growth.
+
+I'd love to explore how we might be able to support {company_name}'s objectives.
+
+Kind regards,
+[Your Name]
+Caprae Capital Partners"""),
+], thresholds=[(20, "high_exec"), (15, "mid_level")], default="standard")
+
+# Command-line tool (lead_tool.py): a single template for every lead
+TOOL_TEMPLATES = TemplateSet([
+    EmailTemplate("default", "\n".join([
+        "Subject: Empowering {company_name} to scale", "",
+        "Hi {first_name},",
+        "",
+        "I hope you're doing well. I'm reaching out because, as {title} at {company_name}, you play an essential role in driving growth.",
+        "At Caprae Capital, we've developed a lightweight tool that helps entrepreneurs streamline operations, uncover opportunities, and close more deals.",
+        "I’d love to schedule a quick call to discuss how we can support {company_name} in reaching its next milestone.",
+        "",
+        "Best regards,",
+        "Your Name",
+        "Caprae Capital",
+    ])),
+], thresholds=[], default="default")
@@ -0,0 +1,117 @@
+"""
+html_extract.py
+===============
+
+Fast lxml-backed extraction of company names from directory listing pages.
+
+Each scrape source has a fixed, ordered list of selectors. They are written
+as XPath and compiled once at import time, with a positional predicate so
+libxml2 stops collecting after the first ``per_selector`` matches instead of
+materialising every hit. Selectors are tried in order and extraction stops as
+soon as enough names have been found, mirroring the
+``soup.select(selector)[:2]`` loops the scrapers used with BeautifulSoup's
+pure-Python ``html.parser``.
+
+Usage:
+    from html_extract import LISTING_EXTRACTORS
+    for index, name in LISTING_EXTRACTORS["apollo"].extract(response.content, limit=3):
+        ...
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import lxml.html
+from lxml import etree
+
+
+def css_class(name: str) -> str:
+    """XPath equivalent of the CSS selector ``.name``."""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+def attr_contains(attr: str, value: str, tag: str = "*") -> str:
+    """XPath equivalent of the CSS selector ``tag[attr*="value"]``."""
+    return f"//{tag}[contains(@{attr}, '{value}')]"
+
+
+# Visible text only, like BeautifulSoup's get_text(): skip script/style bodies
+_TEXT = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script) and not(ancestor::style)]"
+)
+
+
+def element_text(element) -> str:
+    """Concatenate stripped text nodes, matching get_text(strip=True)."""
+    return "".join(piece.strip() for piece in _TEXT(element))
+
+
+def parse_html(content: bytes):
+    """Parse a page with lxml; returns None for empty or unparseable input."""
+    if not content:
+        return None
+    try:
+        return lxml.html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+class ListingExtractor:
+    """Ordered, precompiled selectors for one listing source.
+
+    Names must be longer than min_length characters to count.
+    """
+
+    def __init__(self, selectors: Sequence[str], per_selector: int = 2, min_length: int = 3):
+        self.selectors = list(selectors)
+        self.per_selector = per_selector
+        self.min_length = min_length
+        self._compiled = [
+            etree.XPath(f"({selector})[position() <= {per_selector}]")
+            for selector in self.selectors
+        ]
+
+    def extract_from_tree(self, root, limit: int) -> List[Tuple[int, str]]:
+        """(index within selector, name) pairs, at most limit of them."""
+        found: List[Tuple[int, str]] = []
+        if root is None or limit <= 0:
+            return found
+        for xpath in self._compiled:
+            for i, element in enumerate(xpath(root)):
+                name = element_text(element)
+                if name and len(name) > self.min_length:
+                    found.append((i, name))
+                    if len(found) >= limit:
+                        return found
+        return found
+
+    def extract(self, content: bytes, limit: int) -> List[Tuple[int, str]]:
+        return self.extract_from_tree(parse_html(content), limit)
+
+
+LISTING_SELECTORS: Dict[str, List[str]] = {
+    "apollo": [
+        attr_contains("href", "/organization/", tag="a"),
+        css_class("company-name"),
+        css_class("org-name"),
+        attr_contains("data-test", "company"),
+    ],
+    "linkedin": [
+        css_class("company-name"),
+        attr_contains("data-test", "employer"),
+        css_class("employerName"),
+    ],
+    "crunchbase": [
+        css_class("startup-link"),
+        css_class("product-name"),
+        attr_contains("data-test", "product"),
+    ],
+    "google_maps": [
+        css_class("business-name"),
+        css_class("biz-name"),
+        attr_contains("data-test", "business"),
+    ],
+}
+
+LISTING_EXTRACTORS: Dict[str, ListingExtractor] = {
+    source: ListingExtractor(selectors) for source, selectors in LISTING_SELECTORS.items()
+}
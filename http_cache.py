@@ -0,0 +1,217 @@
+"""
+http_cache.py
+=============
+
+Persistent on-disk cache for GET responses, plugged into a
+``requests.Session`` as a transport adapter.
+
+Responses are stored in a SQLite database together with their ``ETag`` and
+``Last-Modified`` validators. A cached entry younger than the TTL is served
+without touching the network; an older one is revalidated with
+``If-None-Match`` / ``If-Modified-Since`` so an unchanged page costs a 304
+instead of a full download. When the cache grows past its size cap the least
+recently used entries are evicted.
+
+Usage:
+    from http_cache import ResponseCache, install_cache
+    install_cache(session, ResponseCache(".http_cache.sqlite3"))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+DEFAULT_CACHE_PATH = os.environ.get("HTTP_CACHE_PATH", ".http_cache.sqlite3")
+DEFAULT_TTL = float(os.environ.get("HTTP_CACHE_TTL", "86400"))
+DEFAULT_MAX_BYTES = int(float(os.environ.get("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+# Headers describing the wire encoding; the stored body is already decoded
+_DROP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+class CachedEntry:
+    """A stored response body plus the validators needed to revalidate it."""
+
+    __slots__ = ("url", "status_code", "headers", "body", "etag", "last_modified", "stored_at")
+
+    def __init__(self, url, status_code, headers, body, etag, last_modified, stored_at):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+
+class ResponseCache:
+    """SQLite-backed response store with a TTL and an LRU size cap."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                   url TEXT PRIMARY KEY,
+                   status_code INTEGER NOT NULL,
+                   headers TEXT NOT NULL,
+                   body BLOB NOT NULL,
+                   etag TEXT,
+                   last_modified TEXT,
+                   stored_at REAL NOT NULL,
+                   accessed_at REAL NOT NULL,
+                   size INTEGER NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, url: str) -> Optional[CachedEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+        status_code, headers, body, etag, last_modified, stored_at = row
+        return CachedEntry(url, status_code, json.loads(headers), body, etag,
+                           last_modified, stored_at)
+
+    def is_fresh(self, entry: CachedEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def put(self, url: str, status_code: int, headers: dict, body: bytes) -> None:
+        size = len(body)
+        # A single entry may not crowd out most of the cache
+        if size > self.max_bytes // 4:
+            return
+        headers = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status_code, json.dumps(headers), body,
+                 headers.get("ETag") or headers.get("etag"),
+                 headers.get("Last-Modified") or headers.get("last-modified"),
+                 now, now, size),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as freshly validated (after a 304)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size cap. Lock held."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for url, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that answers GETs from a ResponseCache when it can."""
+
+    def __init__(self, cache: ResponseCache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def _build_response(self, request, entry: CachedEntry) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = entry.body
+        response.from_cache = True
+        return response
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        entry = self.cache.get(request.url)
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return self._build_response(request, entry)
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = super().send(request, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            self.cache.touch(request.url)
+            return self._build_response(request, entry)
+
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if response.status_code == 200 and "no-store" not in cache_control:
+            # Reading content here consumes the stream; requests then serves
+            # response.content from memory as usual
+            self.cache.put(request.url, response.status_code,
+                           dict(response.headers), response.content)
+        response.from_cache = False
+        return response
+
+
+def install_cache(session: requests.Session, cache: ResponseCache, **adapter_kwargs) -> CachingAdapter:
+    """Mount a CachingAdapter on both schemes of a session."""
+    adapter = CachingAdapter(cache, **adapter_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
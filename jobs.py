@@ -0,0 +1,163 @@
+"""
+jobs.py
+=======
+
+Small in-process background job queue used by the Flask app so long-running
+scrapes and uploads do not hold a web worker.
+
+A job function receives its ``Job`` as the first argument and reports
+progress through it (``set_total``, ``advance``, ``add_result``); callers
+poll the job by id to read status, progress and the results produced so far.
+
+Each job keeps only its most recent ``max_results`` results, so a job that
+produces millions of them holds a bounded amount of memory; pollers that
+fall behind skip the dropped ones (``results_dropped`` says how many) and
+can read the full data from wherever the job stored it.
+
+Usage:
+    queue = JobQueue(max_workers=4)
+    job = queue.submit("scrape", run_scrape, source, query)
+    queue.get(job.id).to_dict()
+"""
+
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_MAX_RESULTS = 1000
+
+
+class Job:
+    """Status, progress and partial results of one background task."""
+
+    def __init__(self, kind: str, max_results: Optional[int] = DEFAULT_MAX_RESULTS):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = QUEUED
+        self.total = 0
+        self.completed = 0
+        self.message = ""
+        self.error = ""
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        # Ring buffer of the newest results; _published counts all of them
+        self._results: deque = deque(maxlen=max_results)
+        self._published = 0
+        self._lock = threading.Lock()
+
+    def set_total(self, total: int) -> None:
+        with self._lock:
+            self.total = total
+
+    def add_total(self, count: int) -> None:
+        with self._lock:
+            self.total += count
+
+    def advance(self, count: int = 1) -> None:
+        with self._lock:
+            self.completed += count
+
+    def add_result(self, result: Any) -> None:
+        """Publish one result; it becomes visible to pollers at once."""
+        with self._lock:
+            self._results.append(result)
+            self._published += 1
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    def _since(self, since: int) -> List[Any]:
+        """Retained results numbered since or later. Lock held."""
+        first = self._published - len(self._results)
+        return list(islice(self._results, max(0, since - first), None))
+
+    def results(self, since: int = 0) -> List[Any]:
+        with self._lock:
+            return self._since(since)
+
+    def to_dict(self, since: int = 0, include_results: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            data = {
+                "job_id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "total": self.total,
+                "completed": self.completed,
+                "progress": round(self.completed / self.total, 3) if self.total else (1.0 if self.status == DONE else 0.0),
+                "message": self.message,
+                "error": self.error,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "result_count": self._published,
+                "results_dropped": self._published - len(self._results),
+            }
+            if include_results:
+                data["results"] = self._since(since)
+                data["next_since"] = self._published
+        return data
+
+
+class JobQueue:
+    """Thread-pool backed queue that keeps the most recent jobs for polling."""
+
+    def __init__(self, max_workers: int = 4, max_jobs: int = 200,
+                 max_results: Optional[int] = DEFAULT_MAX_RESULTS):
+        self.max_jobs = max_jobs
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args, **kwargs) -> Job:
+        job = Job(kind, self.max_results)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job: Job, fn: Callable[..., Any], args, kwargs) -> None:
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            message = fn(job, *args, **kwargs)
+            if isinstance(message, str):
+                job.message = message
+            job.status = DONE
+        except Exception as e:
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond max_jobs. Lock held."""
+        if len(self._jobs) <= self.max_jobs:
+            return
+        for job_id in [j.id for j in self._jobs.values() if j.finished]:
+            if len(self._jobs) <= self.max_jobs:
+                break
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
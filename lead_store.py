@@ -0,0 +1,622 @@
+"""
+lead_store.py
+=============
+
+Indexed in-memory store for processed leads.
+
+Every lead gets a stable integer id when it is added. The store keeps a hash
+index on email (for cross-batch deduplication and lookup) and a score index
+bucketed by the (small, integral) score value, each bucket a sorted list of
+ids, both overall and per (industry, source) group. Filtering, paging,
+counting, lookup and deletion never scan the full lead list.
+
+Industry and source filters keep the dashboard's case-insensitive substring
+semantics: the query is matched against the distinct group keys (a handful of
+values) and the matching groups' buckets are merged.
+
+Results are ordered by score descending, then by id (insertion order).
+
+``SQLiteLeadStore`` offers the same interface backed by a SQLite database in
+WAL mode, so leads survive restarts and several worker processes can share
+one consistent store.
+"""
+
+import bisect
+import dataclasses
+import heapq
+import sqlite3
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Dashboard score histogram: (label, inclusive upper bound); the last is open
+SCORE_BUCKETS = [("0-10", 10), ("11-15", 15), ("16-20", 20), ("21+", None)]
+
+
+def score_bucket(score: int) -> str:
+    for label, upper in SCORE_BUCKETS:
+        if upper is None or score <= upper:
+            return label
+    return SCORE_BUCKETS[-1][0]
+
+
+def empty_stats() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "score_sum": 0,
+        "industry_counts": {},
+        "source_counts": {},
+        "score_distribution": {label: 0 for label, _ in SCORE_BUCKETS},
+    }
+
+
+class LeadStore:
+    """Thread-safe lead container with email, industry, source and score indexes."""
+
+    def __init__(self):
+        self._leads: Dict[int, Any] = {}
+        self._next_id = 1
+        self._by_email: Dict[str, int] = {}
+        # Dedup key each lead was stored under (see add)
+        self._email_keys: Dict[int, str] = {}
+        # score -> ids in ascending order (ids only grow, so adds append)
+        self._by_score: Dict[int, List[int]] = {}
+        # (industry key, source key) -> the same score index for that group
+        self._by_group: Dict[Tuple[str, str], Dict[int, List[int]]] = {}
+        self._scores: List[int] = []
+        self._version = 0
+        # Running aggregates for stats(), updated on every add/delete
+        self._stats = empty_stats()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return (email or "").strip().lower()
+
+    def _index(self, lead_id: int, lead: Any, email: str) -> None:
+        if email:
+            self._by_email[email] = lead_id
+            self._email_keys[lead_id] = email
+        group = self._by_group.setdefault(self._group_key(lead), {})
+        group.setdefault(lead.score, []).append(lead_id)
+        bucket = self._by_score.get(lead.score)
+        if bucket is None:
+            bucket = self._by_score[lead.score] = []
+            bisect.insort(self._scores, lead.score)
+        bucket.append(lead_id)
+        self._count(lead, 1)
+
+    @staticmethod
+    def _group_key(lead: Any) -> Tuple[str, str]:
+        return (lead.industry or "").lower(), (lead.source or "").lower()
+
+    def _count(self, lead: Any, delta: int) -> None:
+        """Apply one lead's contribution (+1 or -1) to the running aggregates."""
+        stats = self._stats
+        stats["total"] += delta
+        stats["score_sum"] += delta * lead.score
+        for key, value in (("industry_counts", lead.industry), ("source_counts", lead.source)):
+            counts = stats[key]
+            remaining = counts.get(value, 0) + delta
+            if remaining:
+                counts[value] = remaining
+            else:
+                del counts[value]
+        stats["score_distribution"][score_bucket(lead.score)] += delta
+
+    @staticmethod
+    def _discard(index: Dict, key, lead_id: int) -> bool:
+        """Remove lead_id from the sorted list index[key]; True when it became empty."""
+        bucket = index.get(key)
+        if bucket is None:
+            return False
+        position = bisect.bisect_left(bucket, lead_id)
+        if position < len(bucket) and bucket[position] == lead_id:
+            del bucket[position]
+        if not bucket:
+            del index[key]
+            return True
+        return False
+
+    def _unindex(self, lead_id: int, lead: Any) -> None:
+        email = self._email_keys.pop(lead_id, "")
+        if email and self._by_email.get(email) == lead_id:
+            del self._by_email[email]
+        group_key = self._group_key(lead)
+        group = self._by_group.get(group_key)
+        if group is not None and self._discard(group, lead.score, lead_id) and not group:
+            del self._by_group[group_key]
+        if self._discard(self._by_score, lead.score, lead_id):
+            del self._scores[bisect.bisect_left(self._scores, lead.score)]
+        self._count(lead, -1)
+
+    def add(self, lead: Any, email: Optional[str] = None) -> Optional[Any]:
+        """Store a lead and assign its id; returns None if the email is already stored.
+
+        email is the dedup key, normally the email the lead arrived with
+        before enrichment (which may fill in a shared company address);
+        it defaults to lead.email.
+        """
+        with self._lock:
+            email = self._email_key(lead.email if email is None else email)
+            if email and email in self._by_email:
+                return None
+            lead_id = self._next_id
+            self._next_id += 1
+            lead.id = lead_id
+            self._leads[lead_id] = lead
+            self._index(lead_id, lead, email)
+            self._version += 1
+            return lead
+
+    def add_many(self, leads: Iterable[Any], emails: Optional[Iterable[str]] = None) -> List[Any]:
+        """Add leads in order (deduplicated on emails, see add); returns the ones that were not duplicates."""
+        leads = list(leads)
+        keys = list(emails) if emails is not None else [None] * len(leads)
+        with self._lock:
+            return [lead for lead, email in zip(leads, keys) if self.add(lead, email) is not None]
+
+    def get(self, lead_id: int) -> Optional[Any]:
+        return self._leads.get(lead_id)
+
+    def get_by_email(self, email: str) -> Optional[Any]:
+        with self._lock:
+            lead_id = self._by_email.get(self._email_key(email))
+            return self._leads.get(lead_id) if lead_id is not None else None
+
+    def contains_email(self, email: str) -> bool:
+        return self._email_key(email) in self._by_email
+
+    def delete(self, lead_id: int) -> Optional[Any]:
+        """Remove a lead by id; returns it, or None if it did not exist."""
+        with self._lock:
+            lead = self._leads.pop(lead_id, None)
+            if lead is not None:
+                self._unindex(lead_id, lead)
+                self._version += 1
+            return lead
+
+    def delete_many(self, lead_ids: Iterable[int]) -> List[Any]:
+        with self._lock:
+            deleted = [self.delete(lead_id) for lead_id in lead_ids]
+            return [lead for lead in deleted if lead is not None]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._leads.clear()
+            self._by_email.clear()
+            self._email_keys.clear()
+            self._by_group.clear()
+            self._by_score.clear()
+            self._scores.clear()
+            self._stats = empty_stats()
+            self._version += 1
+
+    def _indexes(self, industry: str, source: str) -> List[Dict[int, List[int]]]:
+        """Score indexes covering the industry/source filters. Lock held.
+
+        Filters match the distinct (industry, source) keys, a handful of
+        values, never individual leads.
+        """
+        if not industry and not source:
+            return [self._by_score]
+        industry, source = industry.lower(), source.lower()
+        return [group for (industry_key, source_key), group in self._by_group.items()
+                if industry in industry_key and source in source_key]
+
+    def query(self, min_score: int = 0, industry: str = "", source: str = "",
+              limit: Optional[int] = None, after: Optional[Tuple[int, int]] = None) -> List[Any]:
+        """Leads matching all given filters, best score first.
+
+        after is a (score, id) keyset cursor: only leads ordered strictly after
+        it are returned, at most limit of them. Cost depends on the number of
+        distinct scores and filter groups plus the page size, not on the
+        number of stored leads.
+        """
+        with self._lock:
+            indexes = self._indexes(industry, source)
+            start = bisect.bisect_left(self._scores, min_score) if min_score > 0 else 0
+            end = bisect.bisect_right(self._scores, after[0]) if after else len(self._scores)
+
+            results = []
+            for score in reversed(self._scores[start:end]):
+                wanted = None if limit is None else limit - len(results)
+                runs = []
+                for index in indexes:
+                    ids = index.get(score)
+                    if not ids:
+                        continue
+                    first = bisect.bisect_right(ids, after[1]) if after and score == after[0] else 0
+                    runs.append(ids[first:] if wanted is None else ids[first:first + wanted])
+                ordered = runs[0] if len(runs) == 1 else heapq.merge(*runs)
+                for lead_id in islice(ordered, wanted):
+                    results.append(self._leads[lead_id])
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def count(self, min_score: int = 0, industry: str = "", source: str = "") -> int:
+        """Number of leads query() would return without a limit."""
+        with self._lock:
+            start = bisect.bisect_left(self._scores, min_score) if min_score > 0 else 0
+            scores = self._scores[start:]
+            return sum(len(index.get(score, ())) for index in self._indexes(industry, source)
+                       for score in scores)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever leads are added or removed (used for ETags)."""
+        return self._version
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals, per-industry/source counts and score histogram.
+
+        Read from running aggregates, so the cost depends on the number of
+        distinct industries/sources rather than the number of leads.
+        """
+        with self._lock:
+            stats = self._stats
+            return {
+                "total": stats["total"],
+                "score_sum": stats["score_sum"],
+                "industry_counts": dict(stats["industry_counts"]),
+                "source_counts": dict(stats["source_counts"]),
+                "score_distribution": dict(stats["score_distribution"]),
+            }
+
+    def __len__(self) -> int:
+        return len(self._leads)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Leads in insertion order (a snapshot, safe against concurrent writes)."""
+        with self._lock:
+            return iter(list(self._leads.values()))
+
+
+class SQLiteLeadStore:
+    """LeadStore interface persisted in SQLite (WAL mode).
+
+    lead_type is the dataclass rows are turned back into; its fields become
+    the table columns. Each thread gets its own connection.
+    """
+
+    def __init__(self, path: str, lead_type: Any):
+        self.path = path
+        self.lead_type = lead_type
+        self._fields = [f.name for f in dataclasses.fields(lead_type) if f.name != "id"]
+        self._bool_fields = {f.name for f in dataclasses.fields(lead_type) if f.type in (bool, "bool")}
+        self._local = threading.local()
+        self._create_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self) -> None:
+        columns = ", ".join(f'"{name}"' for name in self._fields)
+        conn = self._conn()
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS leads (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {columns},
+                email_key TEXT NOT NULL DEFAULT '',
+                industry_key TEXT NOT NULL DEFAULT '',
+                source_key TEXT NOT NULL DEFAULT ''
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS leads_email
+                ON leads (email_key) WHERE email_key != '';
+            CREATE INDEX IF NOT EXISTS leads_score ON leads (score DESC, id);
+            -- One ordered run per (industry, source) group, like LeadStore._by_group
+            CREATE INDEX IF NOT EXISTS leads_group ON leads (industry_key, source_key, score DESC, id);
+            DROP INDEX IF EXISTS leads_industry;
+            DROP INDEX IF EXISTS leads_source;
+
+            -- Bumped by triggers so every worker sees the same change counter
+            CREATE TABLE IF NOT EXISTS lead_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            INSERT OR IGNORE INTO lead_meta VALUES ('version', 0);
+            CREATE TRIGGER IF NOT EXISTS leads_version_insert AFTER INSERT ON leads
+                BEGIN UPDATE lead_meta SET value = value + 1 WHERE key = 'version'; END;
+            CREATE TRIGGER IF NOT EXISTS leads_version_delete AFTER DELETE ON leads
+                BEGIN UPDATE lead_meta SET value = value + 1 WHERE key = 'version'; END;
+        """)
+        self._add_missing_columns(conn)
+        self._create_stats_schema(conn)
+
+    def _add_missing_columns(self, conn: sqlite3.Connection) -> None:
+        """Add columns for lead fields introduced since the table was created."""
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(leads)")}
+        defaults = {f.name: f.default for f in dataclasses.fields(self.lead_type)}
+        for name in self._fields:
+            if name in existing:
+                continue
+            default = defaults.get(name)
+            if isinstance(default, str):
+                literal = "'" + default.replace("'", "''") + "'"
+            elif isinstance(default, (bool, int, float)):
+                literal = str(int(default) if isinstance(default, bool) else default)
+            else:
+                literal = "NULL"
+            conn.execute(f'ALTER TABLE leads ADD COLUMN "{name}" DEFAULT {literal}')
+
+    @staticmethod
+    def _bucket_sql(column: str) -> str:
+        """SQL CASE expression mapping a score to its SCORE_BUCKETS label."""
+        whens = " ".join(
+            f"WHEN {column} <= {upper} THEN '{label}'" for label, upper in SCORE_BUCKETS if upper is not None
+        )
+        return f"CASE {whens} ELSE '{SCORE_BUCKETS[-1][0]}' END"
+
+    def _create_stats_schema(self, conn: sqlite3.Connection) -> None:
+        """Aggregates table kept current by triggers, backfilled on first use."""
+        upsert = (
+            "INSERT INTO lead_stats VALUES ({kind}, {key}, {delta}) "
+            "ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count;"
+        )
+
+        def changes(row: str, sign: str) -> str:
+            return "\n".join(upsert.format(kind=f"'{kind}'", key=key, delta=delta) for kind, key, delta in (
+                ("total", "''", f"{sign}1"),
+                ("score_sum", "''", f"{sign}{row}.score"),
+                ("industry", f"{row}.industry", f"{sign}1"),
+                ("source", f"{row}.source", f"{sign}1"),
+                ("bucket", self._bucket_sql(f"{row}.score"), f"{sign}1"),
+            ))
+
+        bucket = self._bucket_sql("score")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Checked inside the write lock so concurrent workers backfill once
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'lead_stats'"
+            ).fetchone()
+            if exists:
+                conn.execute("COMMIT")
+                return
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lead_stats ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, count INTEGER NOT NULL, "
+                "PRIMARY KEY (kind, key))"
+            )
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS leads_stats_insert AFTER INSERT ON leads BEGIN
+                    {changes("NEW", "+")}
+                END""")
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS leads_stats_delete AFTER DELETE ON leads BEGIN
+                    {changes("OLD", "-")}
+                    DELETE FROM lead_stats WHERE kind IN ('industry', 'source') AND count <= 0;
+                END""")
+            # Backfill from rows written before the aggregates existed; keys
+            # go in first-seen order, as the triggers would have added them
+            conn.execute("""
+                INSERT INTO lead_stats
+                SELECT 'total', '', COUNT(*) FROM leads
+                UNION ALL SELECT 'score_sum', '', COALESCE(SUM(score), 0) FROM leads""")
+            for kind in ("industry", "source"):
+                conn.execute(
+                    f"INSERT INTO lead_stats SELECT '{kind}', {kind}, COUNT(*) FROM leads "
+                    f"GROUP BY {kind} ORDER BY MIN(id)"
+                )
+            conn.execute(
+                f"INSERT INTO lead_stats SELECT 'bucket', {bucket}, COUNT(*) FROM leads GROUP BY 2"
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _to_lead(self, row: sqlite3.Row) -> Any:
+        values = {name: row[name] for name in self._fields}
+        for name in self._bool_fields:
+            values[name] = bool(values[name])
+        lead = self.lead_type(**values)
+        lead.id = row["id"]
+        return lead
+
+    def _insert(self, conn: sqlite3.Connection, lead: Any, email: Optional[str]) -> bool:
+        values = [getattr(lead, name) for name in self._fields]
+        values += [
+            LeadStore._email_key(lead.email if email is None else email),
+            (lead.industry or "").lower(),
+            (lead.source or "").lower(),
+        ]
+        columns = ", ".join(f'"{name}"' for name in self._fields)
+        placeholders = ", ".join("?" * len(values))
+        cursor = conn.execute(
+            f"INSERT OR IGNORE INTO leads ({columns}, email_key, industry_key, source_key) "
+            f"VALUES ({placeholders})",
+            values,
+        )
+        if cursor.rowcount != 1:
+            return False
+        lead.id = cursor.lastrowid
+        return True
+
+    def add(self, lead: Any, email: Optional[str] = None) -> Optional[Any]:
+        added = self.add_many([lead], None if email is None else [email])
+        return added[0] if added else None
+
+    def add_many(self, leads: Iterable[Any], emails: Optional[Iterable[str]] = None) -> List[Any]:
+        """Insert a batch in a single transaction; duplicates by email (see LeadStore.add) are skipped."""
+        leads = list(leads)
+        keys = list(emails) if emails is not None else [None] * len(leads)
+        conn = self._conn()
+        added = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for lead, email in zip(leads, keys):
+                if self._insert(conn, lead, email):
+                    added.append(lead)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def get(self, lead_id: int) -> Optional[Any]:
+        row = self._conn().execute("SELECT * FROM leads WHERE id = ?", (lead_id,)).fetchone()
+        return self._to_lead(row) if row else None
+
+    def get_by_email(self, email: str) -> Optional[Any]:
+        row = self._conn().execute(
+            "SELECT * FROM leads WHERE email_key = ?", (LeadStore._email_key(email),)
+        ).fetchone()
+        return self._to_lead(row) if row else None
+
+    def contains_email(self, email: str) -> bool:
+        key = LeadStore._email_key(email)
+        if not key:
+            return False
+        return self._conn().execute(
+            "SELECT 1 FROM leads WHERE email_key = ?", (key,)
+        ).fetchone() is not None
+
+    def delete(self, lead_id: int) -> Optional[Any]:
+        deleted = self.delete_many([lead_id])
+        return deleted[0] if deleted else None
+
+    def delete_many(self, lead_ids: Iterable[int]) -> List[Any]:
+        conn = self._conn()
+        deleted = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for lead_id in lead_ids:
+                row = conn.execute("SELECT * FROM leads WHERE id = ?", (lead_id,)).fetchone()
+                if row is not None:
+                    conn.execute("DELETE FROM leads WHERE id = ?", (lead_id,))
+                    deleted.append(self._to_lead(row))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return deleted
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM leads")
+
+    def _matching_keys(self, kind: str, needle: str) -> List[str]:
+        """Index keys containing needle, from the distinct values in lead_stats."""
+        rows = self._conn().execute("SELECT key FROM lead_stats WHERE kind = ?", (kind,)).fetchall()
+        keys = {(row[0] or "").lower() for row in rows}
+        needle = needle.lower()
+        return [key for key in keys if needle in key]
+
+    def _groups(self, industry: str, source: str) -> Optional[List[Tuple[str, str]]]:
+        """(industry_key, source_key) groups matching the filters; None for no filter.
+
+        Like LeadStore._indexes, filters are matched against the distinct keys
+        (read from the trigger-maintained lead_stats), never against rows.
+        """
+        if not industry and not source:
+            return None
+        return [(industry_key, source_key)
+                for industry_key in self._matching_keys("industry", industry)
+                for source_key in self._matching_keys("source", source)]
+
+    def _score_clauses(self, min_score: int, after: Optional[Tuple[int, int]]) -> Tuple[List[str], List[Any]]:
+        clauses, params = [], []
+        if min_score > 0:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if after:
+            clauses.append("(score < ? OR (score = ? AND id > ?))")
+            params.extend([after[0], after[0], after[1]])
+        return clauses, params
+
+    def _select(self, clauses: List[str], params: List[Any], limit: Optional[int]) -> List[sqlite3.Row]:
+        sql = "SELECT * FROM leads"
+        if clauses:
+            sql += f" WHERE {' AND '.join(clauses)}"
+        sql += " ORDER BY score DESC, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = params + [limit]
+        return self._conn().execute(sql, params).fetchall()
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Read transaction, so queries over several groups see one state."""
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
+
+    def query(self, min_score: int = 0, industry: str = "", source: str = "",
+              limit: Optional[int] = None, after: Optional[Tuple[int, int]] = None) -> List[Any]:
+        """Same contract as LeadStore.query.
+
+        A filtered query reads at most limit rows from each matching group's
+        run of the leads_group index and merges them, so its cost depends on
+        the number of groups and the page size, not on the number of leads.
+        """
+        clauses, params = self._score_clauses(min_score, after)
+        with self._snapshot():
+            groups = self._groups(industry, source)
+            if groups is None:
+                rows = self._select(clauses, params, limit)
+            else:
+                group_clauses = ["industry_key = ?", "source_key = ?"] + clauses
+                runs = [self._select(group_clauses, [industry_key, source_key] + params, limit)
+                        for industry_key, source_key in groups]
+                rows = list(islice(heapq.merge(*runs, key=lambda row: (-row["score"], row["id"])), limit))
+        return [self._to_lead(row) for row in rows]
+
+    def count(self, min_score: int = 0, industry: str = "", source: str = "") -> int:
+        clauses, params = self._score_clauses(min_score, None)
+        with self._snapshot() as conn:
+            groups = self._groups(industry, source)
+            if groups is None:
+                sql = "SELECT COUNT(*) FROM leads"
+                if clauses:
+                    sql += f" WHERE {' AND '.join(clauses)}"
+                return conn.execute(sql, params).fetchone()[0]
+            # Range scans over the covering leads_group index, one per group
+            sql = " AND ".join(["SELECT COUNT(*) FROM leads WHERE industry_key = ?", "source_key = ?"] + clauses)
+            return sum(conn.execute(sql, [industry_key, source_key] + params).fetchone()[0]
+                       for industry_key, source_key in groups)
+
+    @property
+    def version(self) -> int:
+        return self._conn().execute(
+            "SELECT value FROM lead_meta WHERE key = 'version'"
+        ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Read the trigger-maintained aggregates; O(distinct keys).
+
+        Keys come back in the order they were first added (rowid order), as
+        with LeadStore's dicts.
+        """
+        stats = empty_stats()
+        rows = self._conn().execute("SELECT kind, key, count FROM lead_stats ORDER BY rowid").fetchall()
+        for kind, key, count in rows:
+            if kind == "total":
+                stats["total"] = count
+            elif kind == "score_sum":
+                stats["score_sum"] = count
+            elif kind == "industry":
+                stats["industry_counts"][key] = count
+            elif kind == "source":
+                stats["source_counts"][key] = count
+            elif kind == "bucket":
+                stats["score_distribution"][key] = count
+        return stats
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Leads in insertion order, streamed from the database."""
+        cursor = self._conn().execute("SELECT * FROM leads ORDER BY id")
+        for row in cursor:
+            yield self._to_lead(row)
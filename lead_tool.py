@@ -5,10 +5,13 @@ lead_tool.py
 This script processes a CSV of raw leads, removes duplicates, computes a simple
 lead score based on heuristics, and generates a personalised outreach email for
 each contact. The output is written to a new CSV with additional columns for
-score and email template. A summary of the results is printed to the console.
+score and email template id; emails are rendered from the template id and the
+lead's own fields on demand, or written out in full with --inline-templates.
+A summary of the results is printed to the console.
 
 Usage:
     python lead_tool.py --input dataset.csv --output processed_leads.csv
+    python lead_tool.py --input dataset.csv --output processed_leads.csv --inline-templates
 
 The input CSV is expected to have the following columns:
 
@@ -28,8 +31,9 @@ The lead score is calculated as the sum of individual subscores:
 * Industry score: Certain industries may be weighted higher based on
   typical value to Caprae Capital.
 
-You can extend or modify the scoring logic by editing the `_score_title`,
-`_score_revenue`, and `_score_industry` functions below.
+Title and industry keywords live in the rulesets in `scoring_rules.py`
+(`TOOL_TITLE_RULES`, `TOOL_INDUSTRY_RULES`); revenue brackets are in
+`_score_revenue` below. The email wording is in `email_templates.py`.
 """
 
 import argparse
@@ -37,8 +41,17 @@ import csv
 from dataclasses import dataclass
 from typing import Dict, List
 
+from batch_scoring import NUMPY_AVAILABLE, score_tool_batch
+from compact import DATACLASS_SLOTS, intern_fields
+from email_templates import TOOL_TEMPLATES
+from scoring_rules import TOOL_INDUSTRY_RULES, TOOL_TITLE_RULES, parse_tool_revenue
 
-@dataclass
+
+# Low-cardinality columns; interned so repeated values share one string
+CATEGORICAL_FIELDS = ("title", "revenue", "industry")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Lead:
     """Dataclass to store lead information and calculated attributes."""
     first_name: str
@@ -49,7 +62,10 @@ class Lead:
     industry: str
     email: str
     score: int = 0
-    email_template: str = ""
+    template_id: str = ""
+
+    def __post_init__(self):
+        intern_fields(self, CATEGORICAL_FIELDS)
 
 
 def parse_args() -> argparse.Namespace:
@@ -64,7 +80,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--output",
         required=True,
-        help="Path to write the processed leads CSV with scores and emails.",
+        help="Path to write the processed leads CSV with scores and template ids.",
+    )
+    parser.add_argument(
+        "--inline-templates",
+        action="store_true",
+        help="Write the fully rendered email_template column instead of template_id.",
     )
     return parser.parse_args()
 
@@ -90,31 +111,12 @@ def read_leads(csv_path: str) -> List[Lead]:
 
 def _score_title(title: str) -> int:
     """Assign a score based on the job title."""
-    title_lower = title.lower()
-    if any(key in title_lower for key in ["ceo", "chief executive"]):
-        return 5
-    if any(key in title_lower for key in ["cfo", "chief financial"]):
-        return 5
-    if any(key in title_lower for key in ["cto", "chief technology"]):
-        return 4
-    if any(key in title_lower for key in ["vp", "vice president"]):
-        return 3
-    if any(key in title_lower for key in ["manager", "director"]):
-        return 2
-    # Default minimal score for other titles
-    return 1
+    return TOOL_TITLE_RULES.score(title)
 
 
 def _parse_revenue(revenue: str) -> float:
     """Try to parse revenue into a float. Fails gracefully to 0."""
-    revenue = revenue.replace("$", "").replace(",", "").strip().lower()
-    if revenue in ("small", "medium", "large"):
-        # Assign arbitrary numeric values for descriptive revenue sizes
-        return {"small": 5e6, "medium": 100e6, "large": 1e9}[revenue]
-    try:
-        return float(revenue)
-    except ValueError:
-        return 0.0
+    return parse_tool_revenue(revenue)
 
 
 def _score_revenue(revenue: str) -> int:
@@ -133,42 +135,22 @@ def _score_revenue(revenue: str) -> int:
 
 def _score_industry(industry: str) -> int:
     """Assign a score based on industry alignment."""
-    industry_lower = industry.lower()
-    # Customize these values based on Caprae's target sectors
-    if any(key in industry_lower for key in ["technology", "software"]):
-        return 4
-    if any(key in industry_lower for key in ["health", "biotech"]):
-        return 3
-    if any(key in industry_lower for key in ["manufacturing", "industrial"]):
-        return 2
-    # Default minimal score
-    return 1
+    return TOOL_INDUSTRY_RULES.score(industry)
 
 
 def score_lead(lead: Lead) -> None:
-    """Compute the total score for a single lead and generate an email."""
+    """Compute the total score for a single lead and pick its email template."""
     title_score = _score_title(lead.title)
     revenue_score = _score_revenue(lead.revenue)
     industry_score = _score_industry(lead.industry)
     lead.score = title_score + revenue_score + industry_score
-    lead.email_template = generate_email(lead)
+    lead.template_id = TOOL_TEMPLATES.template_id(lead.score)
 
 
 def generate_email(lead: Lead) -> str:
-    """Generate a personalised email template for the given lead."""
-    lines = [
-        f"Subject: Empowering {lead.company_name} to scale", "",
-        f"Hi {lead.first_name},",
-        "",
-        f"I hope you're doing well. I'm reaching out because, as {lead.title} at {lead.company_name}, you play an essential role in driving growth.",
-        "At Caprae Capital, we've developed a lightweight tool that helps entrepreneurs streamline operations, uncover opportunities, and close more deals.",
-        f"I’d love to schedule a quick call to discuss how we can support {lead.company_name} in reaching its next milestone.",
-        "",
-        "Best regards,",
-        "Your Name",
-        "Caprae Capital"
-    ]
-    return "\n".join(lines)
+    """Render the personalised email for the given lead."""
+    template = TOOL_TEMPLATES.get(lead.template_id)
+    return template.render(lead) if template else TOOL_TEMPLATES.render(lead)
 
 
 def remove_duplicates(leads: List[Lead]) -> List[Lead]:
@@ -182,8 +164,13 @@ def remove_duplicates(leads: List[Lead]) -> List[Lead]:
     return unique_leads
 
 
-def write_leads(leads: List[Lead], csv_path: str) -> None:
-    """Write leads with scores and email templates to a CSV file."""
+def write_leads(leads: List[Lead], csv_path: str, inline_templates: bool = False) -> None:
+    """Write leads with scores and email template ids to a CSV file.
+
+    With inline_templates the rendered email is written in an
+    email_template column instead of the template_id.
+    """
+    template_column = "email_template" if inline_templates else "template_id"
     fieldnames = [
         "first_name",
         "last_name",
@@ -193,7 +180,7 @@ def write_leads(leads: List[Lead], csv_path: str) -> None:
         "industry",
         "email",
         "score",
-        "email_template",
+        template_column,
     ]
     with open(csv_path, "w", newline="", encoding="utf-8") as outfile:
         writer = csv.DictWriter(outfile, fieldnames=fieldnames)
@@ -208,7 +195,7 @@ def write_leads(leads: List[Lead], csv_path: str) -> None:
                 "industry": lead.industry,
                 "email": lead.email,
                 "score": lead.score,
-                "email_template": lead.email_template,
+                template_column: generate_email(lead) if inline_templates else lead.template_id,
             })
 
 
@@ -228,9 +215,20 @@ def main():
     before_dedup = len(leads)
     unique_leads = remove_duplicates(leads)
     duplicates_removed = before_dedup - len(unique_leads)
-    for lead in unique_leads:
-        score_lead(lead)
-    write_leads(unique_leads, args.output)
+    if NUMPY_AVAILABLE and unique_leads:
+        # Score the whole list in one vectorized pass, then pick the templates
+        scores = score_tool_batch(
+            [lead.title for lead in unique_leads],
+            [lead.revenue for lead in unique_leads],
+            [lead.industry for lead in unique_leads],
+        )
+        for lead, score in zip(unique_leads, scores.tolist()):
+            lead.score = score
+            lead.template_id = TOOL_TEMPLATES.template_id(score)
+    else:
+        for lead in unique_leads:
+            score_lead(lead)
+    write_leads(unique_leads, args.output, inline_templates=args.inline_templates)
     print_summary(unique_leads, duplicates_removed)
 
 
@@ -0,0 +1,104 @@
+"""
+rate_limit.py
+=============
+
+Per-host token-bucket rate limiter for polite scraping.
+
+Every host gets its own bucket, so waiting on one throttled site never delays
+requests to another. A bucket refills one token per ``min_interval`` seconds,
+or per the host's robots.txt ``Crawl-delay`` when that is longer, and holds at
+most ``burst`` tokens. Callers reserve a token before each request; if the
+bucket is empty the caller sleeps only until its reserved slot comes up.
+
+Usage:
+    limiter = HostRateLimiter(min_interval=2.0)
+    limiter.acquire(url)   # blocks only if url's host is being throttled
+    session.get(url)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+
+DEFAULT_MIN_INTERVAL = float(os.environ.get("SCRAPE_MIN_INTERVAL", "2.0"))
+DEFAULT_BURST = int(os.environ.get("SCRAPE_BURST", "1"))
+MAX_HOSTS = 10000
+
+
+class _Bucket:
+    __slots__ = ("interval", "capacity", "tokens", "updated")
+
+    def __init__(self, interval: float, capacity: int, now: float):
+        self.interval = interval
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        if self.interval <= 0:
+            return 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        # Negative balance: the token is borrowed from the future
+        return -self.tokens * self.interval
+
+
+class HostRateLimiter:
+    """Token bucket per host; crawl_delay(url) may lengthen a host's interval."""
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_INTERVAL, burst: int = DEFAULT_BURST,
+                 crawl_delay: Optional[Callable[[str], Optional[float]]] = None,
+                 max_hosts: int = MAX_HOSTS):
+        self.min_interval = min_interval
+        self.burst = max(1, burst)
+        self.crawl_delay = crawl_delay
+        self.max_hosts = max_hosts
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _interval_for(self, url: str) -> float:
+        interval = self.min_interval
+        if self.crawl_delay is not None:
+            try:
+                delay = self.crawl_delay(url)
+            except Exception:
+                delay = None
+            if delay:
+                interval = max(interval, delay)
+        return interval
+
+    def reserve(self, url: str) -> float:
+        """Reserve the next request slot for url's host; returns seconds to wait."""
+        host = urlparse(url).netloc.lower()
+        interval = self.min_interval
+        with self._lock:
+            bucket = self._buckets.get(host)
+        if bucket is None:
+            # Resolved outside the lock: it may need a robots.txt download
+            interval = self._interval_for(url)
+
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = _Bucket(interval, self.burst, time.monotonic())
+                self._buckets[host] = bucket
+                while len(self._buckets) > self.max_hosts:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(host)
+            return bucket.reserve(time.monotonic())
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to url's host is allowed; returns time waited."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
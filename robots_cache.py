@@ -0,0 +1,153 @@
+"""
+robots_cache.py
+===============
+
+Process-wide cache of parsed robots.txt rules.
+
+Each scheme+host is fetched at most once per TTL and the rules are parsed with
+the standard library's ``urllib.robotparser`` so user-agent groups, Allow /
+Disallow path prefixes and ``Crawl-delay`` are honoured instead of a plain
+substring check. Entries are evicted least-recently-used once ``max_hosts`` is
+reached.
+
+Usage:
+    from robots_cache import robots_cache
+    if robots_cache.can_fetch(session, url):
+        ...
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+
+DEFAULT_TTL = 3600.0
+ERROR_TTL = 300.0
+MAX_HOSTS = 1024
+ROBOTS_TIMEOUT = 5
+
+
+def _host_key(url: str) -> str:
+    """Return the scheme+host cache key for a URL."""
+    parts = urlparse(url)
+    scheme = (parts.scheme or "https").lower()
+    return f"{scheme}://{parts.netloc.lower()}"
+
+
+def _allow_all() -> RobotFileParser:
+    rules = RobotFileParser()
+    rules.allow_all = True
+    rules.modified()
+    return rules
+
+
+def _disallow_all() -> RobotFileParser:
+    rules = RobotFileParser()
+    rules.disallow_all = True
+    rules.modified()
+    return rules
+
+
+class RobotsCache:
+    """Thread-safe TTL + LRU cache of robots.txt rules keyed by scheme+host."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_hosts: int = MAX_HOSTS,
+                 error_ttl: float = ERROR_TTL, timeout: float = ROBOTS_TIMEOUT):
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.max_hosts = max_hosts
+        self.timeout = timeout
+        self._entries: "OrderedDict[str, Tuple[float, RobotFileParser]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+
+    def _lookup(self, key: str) -> Optional[RobotFileParser]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, rules = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return rules
+
+    def _store(self, key: str, rules: RobotFileParser, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, rules)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_hosts:
+                self._entries.popitem(last=False)
+
+    def _fetch(self, session: requests.Session, key: str) -> Tuple[RobotFileParser, float]:
+        """Download and parse robots.txt, mapping failures the way crawlers do."""
+        try:
+            response = session.get(f"{key}/robots.txt", timeout=self.timeout)
+        except requests.RequestException:
+            # Unreachable host: stay permissive, but retry sooner
+            return _allow_all(), self.error_ttl
+
+        if response.status_code in (401, 403):
+            return _disallow_all(), self.ttl
+        if 400 <= response.status_code < 500:
+            return _allow_all(), self.ttl
+        if response.status_code >= 500:
+            return _allow_all(), self.error_ttl
+
+        rules = RobotFileParser()
+        rules.parse(response.text.splitlines())
+        return rules, self.ttl
+
+    def rules_for(self, session: requests.Session, url: str) -> RobotFileParser:
+        """Return the parsed rules for the host of url, fetching on a miss."""
+        key = _host_key(url)
+        rules = self._lookup(key)
+        if rules is not None:
+            return rules
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        # Only one thread downloads a given host's robots.txt; the rest wait
+        with fetch_lock:
+            rules = self._lookup(key)
+            if rules is None:
+                rules, ttl = self._fetch(session, key)
+                self._store(key, rules, ttl)
+        with self._lock:
+            self._fetch_locks.pop(key, None)
+        return rules
+
+    def can_fetch(self, session: requests.Session, url: str) -> bool:
+        """Whether the session's user agent may fetch url."""
+        user_agent = session.headers.get("User-Agent", "*")
+        return self.rules_for(session, url).can_fetch(user_agent, url)
+
+    def crawl_delay(self, session: requests.Session, url: str) -> Optional[float]:
+        """Crawl-delay (seconds) declared for the session's user agent, if any."""
+        user_agent = session.headers.get("User-Agent", "*")
+        rules = self.rules_for(session, url)
+        delay = rules.crawl_delay(user_agent)
+        if delay is None:
+            rate = rules.request_rate(user_agent)
+            if rate is not None and rate.requests:
+                return rate.seconds / rate.requests
+            return None
+        return float(delay)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared by every LeadProcessor in the process
+robots_cache = RobotsCache()
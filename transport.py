@@ -0,0 +1,198 @@
+"""
+transport.py
+============
+
+Connection pooling, retries and a per-host circuit breaker for the
+``requests.Session`` used by scrapers and enrichment.
+
+* Pools: ``pool_connections`` hosts keep a live pool, each holding up to
+  ``pool_maxsize`` keep-alive connections, sized so concurrent enrichment
+  workers do not discard and re-open connections.
+* Retries: idempotent requests are retried on retryable statuses (429, 502,
+  503, 504) with bounded exponential backoff plus jitter, honouring
+  ``Retry-After``. Connection errors get fewer retries, failed DNS lookups
+  and read timeouts none: dead domains are rarely transient and a slow
+  host should not multiply a worker's timeout.
+* Circuit breaker: after ``failure_threshold`` consecutive failures (errors
+  or 5xx/429 after retries) a host is skipped for ``reset_timeout`` seconds;
+  then a single trial request decides whether it is closed again. Skipped
+  requests fail fast with ``CircuitOpenError``, a ``requests``
+  ``ConnectionError``, so existing error handling applies.
+
+The breaker sits below the response cache, so fresh cached pages are still
+served while a host's circuit is open.
+
+Usage:
+    from transport import install_transport
+    install_transport(session, cache=ResponseCache())
+"""
+
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2
+    NameResolutionError = ()
+
+from http_cache import CachingAdapter, ResponseCache
+
+# backoff_max and backoff_jitter are Retry arguments only from urllib3 2.0;
+# 1.26 reads the cap from a class attribute and has no jitter
+_RETRY_PARAMS = set(inspect.signature(Retry.__init__).parameters)
+
+
+DEFAULT_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "32"))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "16"))
+DEFAULT_RETRIES = int(os.environ.get("HTTP_RETRIES", "2"))
+DEFAULT_CONNECT_RETRIES = int(os.environ.get("HTTP_CONNECT_RETRIES", "1"))
+DEFAULT_BACKOFF = float(os.environ.get("HTTP_BACKOFF", "0.5"))
+DEFAULT_BACKOFF_MAX = float(os.environ.get("HTTP_BACKOFF_MAX", "8"))
+DEFAULT_BACKOFF_JITTER = float(os.environ.get("HTTP_BACKOFF_JITTER", "0.5"))
+DEFAULT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURES", "5"))
+DEFAULT_RESET_TIMEOUT = float(os.environ.get("CIRCUIT_RESET_SECONDS", "60"))
+
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of contacting a host whose circuit is open."""
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class CircuitBreaker:
+    """Per-host consecutive-failure breaker with a half-open trial."""
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT, max_hosts: int = 10000):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_hosts = max_hosts
+        # host -> [consecutive failures, opened at (0 when closed), trial in flight]
+        self._hosts: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Whether a request to host may go out now."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or not state[1]:
+                return True
+            if time.monotonic() - state[1] < self.reset_timeout or state[2]:
+                return False
+            # Half-open: let exactly one trial request through
+            state[2] = True
+            return True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = [0, 0.0, False]
+                while len(self._hosts) > self.max_hosts:
+                    self._hosts.popitem(last=False)
+            self._hosts.move_to_end(host)
+            state[0] += 1
+            if state[2] or state[0] >= self.failure_threshold:
+                state[1] = time.monotonic()
+            state[2] = False
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(host)
+            return bool(state and state[1])
+
+
+class TransportRetry(Retry):
+    """Retry policy that treats a failed DNS lookup as final."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, NameResolutionError):
+            raise MaxRetryError(_pool, url, error) from error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def build_retry(retries: int = DEFAULT_RETRIES, connect_retries: int = DEFAULT_CONNECT_RETRIES,
+                backoff: float = DEFAULT_BACKOFF,
+                backoff_max: float = DEFAULT_BACKOFF_MAX,
+                backoff_jitter: float = DEFAULT_BACKOFF_JITTER) -> Retry:
+    """Bounded exponential backoff with jitter for idempotent requests."""
+    kwargs = dict(
+        total=retries,
+        connect=min(connect_retries, retries),
+        read=0,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    if "backoff_max" in _RETRY_PARAMS:
+        kwargs["backoff_max"] = backoff_max
+    else:
+        TransportRetry.DEFAULT_BACKOFF_MAX = backoff_max
+    if "backoff_jitter" in _RETRY_PARAMS:
+        kwargs["backoff_jitter"] = backoff_jitter
+    return TransportRetry(**kwargs)
+
+
+class CircuitBreakerAdapter(HTTPAdapter):
+    """HTTPAdapter that consults a CircuitBreaker around every network send."""
+
+    def __init__(self, breaker: Optional[CircuitBreaker] = None, **kwargs):
+        self.breaker = breaker or CircuitBreaker()
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = host_of(request.url)
+        if not self.breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}", request=request)
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.breaker.record_failure(host)
+            raise
+        if response.status_code >= 500 or response.status_code == 429:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return response
+
+
+class CachingTransportAdapter(CachingAdapter, CircuitBreakerAdapter):
+    """Cache lookups first; only real network sends pass through the breaker."""
+
+
+def install_transport(session: requests.Session, cache: Optional[ResponseCache] = None,
+                      breaker: Optional[CircuitBreaker] = None,
+                      pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                      pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                      retry: Optional[Retry] = None) -> HTTPAdapter:
+    """Mount a pooled, retrying, circuit-breaking adapter (cached if given a cache)."""
+    kwargs = dict(
+        breaker=breaker,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry if retry is not None else build_retry(),
+    )
+    adapter = CachingTransportAdapter(cache, **kwargs) if cache is not None else CircuitBreakerAdapter(**kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter